@@ -5,6 +5,7 @@ __all__ = [
     "categorizer",
     "renderer",
     "vcs",
+    "models",
 ]
 
 __version__ = "0.1.0"
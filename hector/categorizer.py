@@ -1,35 +1,216 @@
 import re
+import string
 from collections.abc import Iterable
+from functools import lru_cache
+from itertools import accumulate
+from typing import NamedTuple
 
+try:  # Optional accelerator: single-pass multi-keyword scan (pip install pyahocorasick)
+    import ahocorasick
+except Exception:  # pragma: no cover - import-time guard
+    ahocorasick = None  # type: ignore
 
+_NORM_PUNCT = re.compile(r"[^a-z0-9\s\-]")
+_NORM_WS = re.compile(r"\s+")
+# ASCII fast path: map every char outside [a-z0-9-] to a space, no regex pass needed
+_ASCII_KEEP = frozenset(string.ascii_lowercase + string.digits + "-")
+_ASCII_TRANS = str.maketrans({chr(i): " " for i in range(128) if chr(i) not in _ASCII_KEEP})
+
+
+@lru_cache(maxsize=8192)
 def _normalize(text: str) -> str:
-    """Lowercase, replace connectors, strip punctuation, and compress whitespace."""
+    """Lowercase, replace connectors, strip punctuation, and compress whitespace.
+
+    Memoized: synonym phrases are normalized thousands of times per scan.
+    """
     text = text.lower()
     text = text.replace("&", " and ")
-    text = re.sub(r"[^a-z0-9\s\-]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    if text.isascii():
+        # str.split() already collapses runs of whitespace
+        return " ".join(text.translate(_ASCII_TRANS).split())
+    text = _NORM_PUNCT.sub(" ", text)
+    text = _NORM_WS.sub(" ", text).strip()
     return text
 
 
+@lru_cache(maxsize=256)
+def _compile_category(cat_key: tuple[str, ...]) -> re.Pattern | None:
+    """Compile all phrases of a category into ONE alternation pattern.
+
+    Each phrase keeps the matching rules of _phrase_in_text: single tokens of 3-8
+    chars match as plain substrings, everything else is word-bounded (multi-word
+    phrases tolerate whitespace variations). Returns None if no phrase survives
+    normalization.
+
+    Only _phrase_in_text uses this now; categorize_repository goes through
+    build_matcher instead.
+    """
+    loose: list[str] = []
+    bounded: list[str] = []
+    for phrase in cat_key:
+        p = _normalize(phrase)
+        if not p:
+            continue
+        if _is_loose(p):
+            loose.append(re.escape(p))
+        else:
+            bounded.append(re.escape(p).replace(r"\ ", r"\s+"))
+    alts: list[str] = []
+    if bounded:
+        alts.append(r"(?:^|\b)(?:" + "|".join(dict.fromkeys(bounded)) + r")(?:\b|$)")
+    alts.extend(dict.fromkeys(loose))
+    if not alts:
+        return None
+    return re.compile("|".join(alts))
+
+
+def _is_loose(p: str) -> bool:
+    """Single tokens of 3-8 chars match as substrings; everything else is word-bounded."""
+    return " " not in p and 3 <= len(p) <= 8
+
+
+@lru_cache(maxsize=32)
+def _build_automaton(cat_items: tuple[tuple[str, tuple[str, ...]], ...]):
+    """Build one Aho-Corasick automaton over the normalized phrases of all categories.
+
+    Payload per phrase is (length, loose, categories) so a hit can be checked for
+    word boundaries and mapped back to every category that declares the phrase.
+    Returns None when pyahocorasick is not installed or there is nothing to match.
+    """
+    if ahocorasick is None:
+        return None
+    owners: dict[str, list[str]] = {}
+    for cat, phrases in cat_items:
+        for phrase in phrases:
+            p = _normalize(phrase)
+            if p and cat not in owners.setdefault(p, []):
+                owners[p].append(cat)
+    if not owners:
+        return None
+    automaton = ahocorasick.Automaton()
+    for p, cats in owners.items():
+        automaton.add_word(p, (len(p), _is_loose(p), tuple(cats)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _bounded(text: str, start: int, end: int) -> bool:
+    """Emulate the (?:^|\b)...(?:\b|$) guards of the regex path for text[start:end]."""
+    if start > 0 and text[start - 1].isalnum() == text[start].isalnum():
+        return False
+    if end < len(text) and text[end - 1].isalnum() == text[end].isalnum():
+        return False
+    return True
+
+
+def _automaton_hits(automaton, text: str) -> set[str]:
+    """Scan normalized text once and return the categories whose phrases matched."""
+    hits: set[str] = set()
+    for end, (length, loose, cats) in automaton.iter(text):
+        if loose or _bounded(text, end - length + 1, end + 1):
+            hits.update(cats)
+    return hits
+
+
+# Normalized text is [a-z0-9 -]: alnum runs plus single separator chars (the
+# pattern matches every character, so its tokens tile any input exactly)
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[^a-z0-9]")
+
+
+class _TrieNode:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.terminal: set[str] = set()
+
+
+class SynTrie:
+    """Token trie over normalized category phrases, built once per config.
+
+    Word-bounded phrases are stored as token paths so a repo's token stream is
+    walked once per start position. Loose 3-8 char tokens must still match inside
+    compounds (fhir -> smartonfhir), so they are kept aside as plain substrings.
+    """
+
+    __slots__ = ("root", "loose")
+
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+        self.loose: dict[str, set[str]] = {}
+
+    def insert(self, phrase: str, category: str) -> None:
+        p = _normalize(phrase)
+        if not p:
+            return
+        if _is_loose(p):
+            self.loose.setdefault(p, set()).add(category)
+            return
+        node = self.root
+        for tok in _TOKEN_RE.findall(p):
+            node = node.children.setdefault(tok, _TrieNode())
+        node.terminal.add(category)
+
+    def match(self, text: str) -> set[str]:
+        """Return the categories matched in already-normalized text."""
+        hits: set[str] = set()
+        for p, cats in self.loose.items():
+            if p in text:
+                hits.update(cats)
+        # Tokens tile the text, so end offsets are a running sum of token lengths;
+        # findall + accumulate stay in C instead of building a Match per token
+        toks = _TOKEN_RE.findall(text)
+        ends = list(accumulate(map(len, toks)))
+        n = len(toks)
+        root_children = self.root.children
+        for i, tok in enumerate(toks):
+            node = root_children.get(tok)
+            if node is None:
+                continue
+            start = ends[i] - len(tok)
+            j = i
+            while node is not None:
+                if node.terminal and _bounded(text, start, ends[j]):
+                    hits.update(node.terminal)
+                j += 1
+                if j == n:
+                    break
+                node = node.children.get(toks[j])
+        return hits
+
+
+@lru_cache(maxsize=32)
+def _build_trie(cat_items: tuple[tuple[str, tuple[str, ...]], ...]) -> SynTrie:
+    """Build the pure-Python matcher used when pyahocorasick is not installed."""
+    trie = SynTrie()
+    for cat, phrases in cat_items:
+        for phrase in phrases:
+            trie.insert(phrase, cat)
+    return trie
+
+
 def _phrase_in_text(phrase: str, text: str) -> bool:
-    """Check if a phrase exists with word boundaries (allowing whitespace variations)."""
+    """Check if a phrase exists with word boundaries (allowing whitespace variations).
+
+    Single tokens of 3-8 chars use relaxed substring matching to catch root words
+    and acronyms in compounds (health -> healthcare, fhir -> smartonfhir); shorter or
+    longer tokens and multi-word phrases are word-bounded.
+
+    Kept as the single-phrase reference for tests and external callers;
+    categorize_repository matches all phrases at once through build_matcher, which
+    follows the same rules.
+    """
     p = _normalize(phrase)
-    t = _normalize(text)
     if not p:
         return False
-    # For single tokens without spaces, apply smart matching by length
-    if " " not in p:
-        # 3-8 chars: relaxed substring match for root words and acronyms
-        # Catches: health, medical, clinical, dicom, imaging, healthcare, telemedicine
-        # Also catches acronyms in compounds: smartonfhir, mednlp, smartonfhir
-        if 3 <= len(p) <= 8:
-            return p in t
-        # <3 or >8 chars: use word boundaries to avoid false matches on very short or long tokens
-        pattern = r"(?:^|\b)" + re.escape(p) + r"(?:\b|$)"
-        return re.search(pattern, t) is not None
-    # Multi-word phrases: respect word boundaries around the whole phrase
-    pattern = r"(?:^|\b)" + re.escape(p).replace(r"\ ", r"\s+") + r"(?:\b|$)"
-    return re.search(pattern, t) is not None
+    t = _normalize(text)
+    # Common case first: most phrases are absent, and str.__contains__ is far cheaper
+    # than a regex search. Multi-word phrases may span varied whitespace, so only the
+    # first token is required verbatim.
+    if p.split(" ", 1)[0] not in t:
+        return False
+    pattern = _compile_category((p,))
+    return pattern is not None and pattern.search(t) is not None
 
 
 # Sensible default synonyms to greatly reduce "Uncategorized" cases.
@@ -168,37 +349,154 @@ _HEALTHCARE_ANCHORS: list[str] = [
 ]
 
 
+# Normalized text is [a-z0-9 -], so a word-bounded alnum term is exactly one of its
+# alnum runs: membership in the token set replaces a boundary regex search
+_ALNUM_RE = re.compile(r"[a-z0-9]+")
+
+# Short anchors/indicators (<=4 / <=5 chars, single word) need word boundaries to avoid
+# false positives, e.g. "care" should not match "scare" or "childcare"
+_SHORT_ANCHORS = tuple(a for a in _HEALTHCARE_ANCHORS if len(a) <= 4)
+_LONG_ANCHORS = tuple(a for a in _HEALTHCARE_ANCHORS if len(a) > 4)
+# Multi-word or long indicators (ros2, autonomous driving, navigation stack) are exact
+# substring matches; single short words (ros, robot, drone) are word-bounded
+_SHORT_INDICATORS = tuple(i for i in _NON_HEALTHCARE_INDICATORS if not (" " in i or len(i) > 5))
+_LONG_INDICATORS = tuple(i for i in _NON_HEALTHCARE_INDICATORS if " " in i or len(i) > 5)
+
+
+@lru_cache(maxsize=8192)
+def _token_set(normalized: str) -> frozenset[str]:
+    """Alnum runs of already-normalized text, computed once per repo text."""
+    return frozenset(_ALNUM_RE.findall(normalized))
+
+
+def _has_health_anchor(normalized: str) -> bool:
+    if any(anchor in normalized for anchor in _LONG_ANCHORS):
+        return True
+    return not _token_set(normalized).isdisjoint(_SHORT_ANCHORS)
+
+
+def _has_non_health_indicator(normalized: str) -> bool:
+    if any(ind in normalized for ind in _LONG_INDICATORS):
+        return True
+    return not _token_set(normalized).isdisjoint(_SHORT_INDICATORS)
+
+
+# Raw-text wrappers kept for tests and external callers; categorize_repository
+# normalizes once and calls the helpers above directly.
 def _is_healthcare_relevant(text: str) -> bool:
     """Check if text contains healthcare domain anchors (strict allowlist)."""
-    normalized = _normalize(text)
-    for anchor in _HEALTHCARE_ANCHORS:
-        # Short anchors (<=4 chars) need word boundaries to avoid false positives
-        # e.g., "care" should not match "scare" or "childcare"
-        if len(anchor) <= 4:
-            pattern = r"(?:^|\b)" + re.escape(anchor) + r"(?:\b|$)"
-            if re.search(pattern, normalized):
-                return True
-        else:
-            if anchor in normalized:
-                return True
-    return False
+    return _has_health_anchor(_normalize(text))
 
 
 def _has_non_healthcare_context(text: str) -> bool:
     """Check if text contains non-healthcare indicators (robotics, autonomous systems, etc.)."""
-    normalized = _normalize(text)
-    for ind in _NON_HEALTHCARE_INDICATORS:
-        # Use word boundaries for single-word indicators (ros, robot, drone)
-        # Multi-word indicators (ros2, autonomous driving, navigation stack) are exact matches
-        if " " in ind or len(ind) > 5:  # multi-word or long exact matches
-            if ind in normalized:
-                return True
-        else:
-            # Single short words need word boundaries to avoid "scare" matching "care"
-            pattern = r"(?:^|\b)" + re.escape(ind) + r"(?:\b|$)"
-            if re.search(pattern, normalized):
-                return True
-    return False
+    return _has_non_health_indicator(_normalize(text))
+
+
+_AI_CATEGORY = "AI Diagnostics"
+
+# AI-related terms for the AI Diagnostics fallback (substring matches)
+_AI_INDICATORS: tuple[str, ...] = (
+    "ai",
+    "artificial intelligence",
+    "machine learning",
+    "deep learning",
+    "foundation model",
+    "large language model",
+    "llm",
+    "vision-language model",
+    "vlm",
+    "multimodal",
+    "multi-modal",
+    "vqa",
+    "retrieval augmented generation",
+    "retrieval-augmented generation",
+    "rag",
+    "agent",
+    "agentic",
+    "transformer",
+    "attention",
+    "self-attention",
+    "graph neural network",
+    "gnn",
+    "graph-based attention",
+    "gat",
+    "gcn",
+    "graph attention network",
+    "medical reasoning",
+    "clinical decision support",
+)
+
+
+@lru_cache(maxsize=8)
+def _merged_keywords(
+    user_kw_frozen: tuple[tuple[str, tuple[str, ...]], ...] | None,
+) -> dict[str, list[str]]:
+    """Merge default keywords with user-provided ones (extend existing where applicable).
+
+    Phrases are stored normalized, with the normalized category label first, so a
+    category's label and synonyms are matched together in one pass.
+    """
+    kw_map: dict[str, list[str]] = {k: list(v) for k, v in DEFAULT_KEYWORDS.items()}
+    for cat, kws in user_kw_frozen or ():
+        key = str(cat).strip()
+        if not key:
+            continue
+        base = kw_map.get(key, [])
+        # Keep only non-empty strings
+        extra = [str(x).strip() for x in kws if str(x).strip()]
+        kw_map[key] = list(dict.fromkeys(base + extra))  # dedupe, preserve order
+    for key, raw_phrases in kw_map.items():
+        phrases = (_normalize(p) for p in [key, *raw_phrases])
+        kw_map[key] = list(dict.fromkeys(p for p in phrases if p))
+    return kw_map
+
+
+def merge_keywords(keywords: dict[str, list[str]] | None = None) -> dict[str, list[str]]:
+    """Return DEFAULT_KEYWORDS merged with config overrides, cached per keyword config.
+
+    Compute this once per scan and pass it to categorize_repository(kw_map=...).
+    The returned mapping is shared between callers and must not be mutated.
+    """
+    frozen = tuple((k, tuple(v or ())) for k, v in keywords.items()) if keywords else None
+    return _merged_keywords(frozen)
+
+
+class CategoryMatcher(NamedTuple):
+    """Phrase index over a category list, built once and reused for every repo."""
+
+    cat_items: tuple[tuple[str, tuple[str, ...]], ...]
+    engine: object  # ahocorasick.Automaton, or SynTrie when pyahocorasick is missing
+    ai_fallback: bool = False  # "AI Diagnostics" is among the categories
+
+    def hits(self, text: str) -> set[str]:
+        """Return the categories whose label or synonyms occur in normalized text."""
+        if isinstance(self.engine, SynTrie):
+            return self.engine.match(text)
+        return _automaton_hits(self.engine, text)
+
+
+def build_matcher(
+    categories: Iterable[str],
+    keywords: dict[str, list[str]] | None = None,
+    kw_map: dict[str, list[str]] | None = None,
+) -> CategoryMatcher:
+    """Index the label and synonyms of every category for categorize_repository(matcher=...)."""
+    if kw_map is None:
+        kw_map = merge_keywords(keywords)
+    labels = [str(c) for c in categories]
+    # kw_map entries already lead with the normalized label; undeclared categories
+    # match on their label alone
+    cat_items = tuple(
+        (norm_cat, tuple(kw_map.get(norm_cat) or (_normalize(norm_cat),)))
+        for norm_cat in (c.strip() for c in labels)
+        if norm_cat
+    )
+    # Single O(len(text)) automaton scan when available, else one token-trie walk
+    automaton = _build_automaton(cat_items)
+    engine = automaton if automaton is not None else _build_trie(cat_items)
+    ai_fallback = any(_normalize(c) == _normalize(_AI_CATEGORY) for c in labels)
+    return CategoryMatcher(cat_items, engine, ai_fallback)
 
 
 def categorize_repository(
@@ -207,89 +505,41 @@ def categorize_repository(
     categories: Iterable[str],
     keywords: dict[str, list[str]] | None = None,
     require_health_context: bool = True,
+    kw_map: dict[str, list[str]] | None = None,
+    matcher: CategoryMatcher | None = None,
 ) -> list[str]:
     """Assign categories using phrase and synonym matching in name/description.
 
     - Direct phrase match against the category name (case-insensitive, word-bounded)
     - Fallback to synonyms defined in DEFAULT_KEYWORDS and optional overrides from config
+    - A precomputed kw_map (from merge_keywords) skips the per-call keyword merge
+    - A prebuilt matcher (from build_matcher) skips rebuilding the phrase index;
+      it must have been built from the same categories
     - AI-related fallback only applies if healthcare context is detected
     - Returns empty list (Uncategorized) if non-healthcare indicators detected
     - Healthcare relevance pre-filter: if no health context, returns Uncategorized
     """
+    # Normalize once; every check below works on this text and its cached token set
     text = _normalize(f"{name} {description}")
+    health_context = _has_health_anchor(text)
 
     # Healthcare relevance pre-filter (Task 3): skip categorization if no health context
-    if require_health_context and not _is_healthcare_relevant(text):
+    if require_health_context and not health_context:
         return []
 
     # Negative-context guard: skip categorization for robotics/autonomous systems
-    if _has_non_healthcare_context(text):
+    if _has_non_health_indicator(text):
         return []
 
-    matched: list[str] = []
-
-    # Merge default keywords with user-provided ones (extend existing where applicable)
-    kw_map: dict[str, list[str]] = {k: list(v) for k, v in DEFAULT_KEYWORDS.items()}
-    if keywords:
-        for cat, kws in keywords.items():
-            key = str(cat).strip()
-            if not key:
-                continue
-            base = kw_map.get(key, [])
-            # Keep only non-empty strings
-            extra = [str(x).strip() for x in (kws or []) if str(x).strip()]
-            kw_map[key] = list(dict.fromkeys(base + extra))  # dedupe, preserve order
-
-    for cat in categories:
-        norm_cat = str(cat).strip()
-        if not norm_cat:
-            continue
-        # Direct phrase match to the category label
-        if _phrase_in_text(norm_cat, text):
-            matched.append(norm_cat)
-            continue
-        # Synonym/keyword matches
-        for kw in kw_map.get(norm_cat, []):
-            if _phrase_in_text(kw, text):
-                matched.append(norm_cat)
-                break
+    if matcher is None:
+        matcher = build_matcher(categories, keywords, kw_map)
+    hits = matcher.hits(text)
+    matched: list[str] = [cat for cat, _ in matcher.cat_items if cat in hits]
 
     # Fallback: if nothing matched but text is clearly AI-related AND has healthcare context,
     # map to AI Diagnostics. Without healthcare context, repos get "Uncategorized".
-    if not matched and _is_healthcare_relevant(text):
-        ai_indicators = [
-            "ai",
-            "artificial intelligence",
-            "machine learning",
-            "deep learning",
-            "foundation model",
-            "large language model",
-            "llm",
-            "vision-language model",
-            "vlm",
-            "multimodal",
-            "multi-modal",
-            "vqa",
-            "retrieval augmented generation",
-            "retrieval-augmented generation",
-            "rag",
-            "agent",
-            "agentic",
-            "transformer",
-            "attention",
-            "self-attention",
-            "graph neural network",
-            "gnn",
-            "graph-based attention",
-            "gat",
-            "gcn",
-            "graph attention network",
-            "medical reasoning",
-            "clinical decision support",
-        ]
-        if any(ind in text for ind in ai_indicators) and any(
-            _normalize(str(c)) == _normalize("AI Diagnostics") for c in categories
-        ):
-            matched.append("AI Diagnostics")
+    if not matched and health_context and matcher.ai_fallback:
+        if any(ind in text for ind in _AI_INDICATORS):
+            matched.append(_AI_CATEGORY)
 
     return matched
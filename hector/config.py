@@ -1,18 +1,36 @@
+import copy
 import os
 from typing import Any
 
 import yaml
 
+try:  # libyaml-backed parser, ~10x faster; PyYAML wheels normally ship with it
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 REQUIRED_TOP_LEVEL_KEYS = ["search", "weights", "output"]
 
+# Parsed YAML keyed by (absolute path, mtime_ns); edits to the file invalidate the entry
+_CFG_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
+
 
 def load_config(path: str = "config.yaml") -> dict[str, Any]:
-    """Load YAML config, inject env overrides, and validate."""
+    """Load YAML config, inject env overrides, and validate.
+
+    The parsed YAML is cached per (path, mtime); every call gets its own deep copy,
+    and env overrides and validation are applied fresh each time.
+    """
     if not os.path.exists(path):
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(path, encoding="utf-8") as f:
-        cfg = yaml.safe_load(f) or {}
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    parsed = _CFG_CACHE.get(key)
+    if parsed is None:
+        with open(path, encoding="utf-8") as f:
+            parsed = yaml.load(f, Loader=_Loader) or {}
+        _CFG_CACHE[key] = parsed
+    cfg = copy.deepcopy(parsed)
 
     # Inject environment variables (e.g., GitHub token)
     token = os.getenv("GITHUB_TOKEN")
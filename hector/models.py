@@ -0,0 +1,35 @@
+from dataclasses import dataclass, fields
+from typing import Any
+
+
+@dataclass(slots=True)
+class Item:
+    """A curated repository entry as rendered into the Markdown index.
+
+    Producers emit Items instead of per-repo dicts: attributes live in fixed slots
+    (no per-instance __dict__), so entries stay small and attribute access in the
+    renderer avoids dict hashing. Items are mutable so the score can be filled in
+    after batch scoring.
+    """
+
+    name: str = "repo"
+    url: str = ""
+    score: float = 0.0
+    description: str = ""
+    categories: tuple[str, ...] = ()
+    license: str = ""
+    stars: int = 0
+    forks: int = 0
+    prs_open: int | None = None
+    has_discussions: bool | None = None
+    contributors_count: int | None = None
+    contributors_count_capped: bool | None = None
+    days_since_push: int | None = None
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "Item":
+        """Build an Item from a legacy item dict, ignoring unknown keys."""
+        return cls(**{k: d[k] for k in _ITEM_FIELDS if k in d})
+
+
+_ITEM_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Item))
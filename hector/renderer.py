@@ -1,57 +1,89 @@
-from collections import defaultdict
+import io
 from collections.abc import Iterable
+from itertools import groupby
+from operator import itemgetter
+from os import PathLike
+from typing import TextIO
 
+from hector.models import Item
 
-def render_markdown(items: list[dict], output_file: str, categories: Iterable[str]) -> None:
+# One format call per item instead of an f-string per line
+_ITEM_TMPL = (
+    "- **[{name}]({url})** (Score: {score})\n"
+    "  - License: {lic} | Stars: {stars} | Forks: {forks}\n"
+)
+_EXTRAS_TMPL = "  - {}\n"
+_DESC_TMPL = "  - Description: {}\n"
+
+
+def render_markdown(
+    items: Iterable[Item | dict],
+    output_file: str | PathLike[str] | TextIO,
+    categories: Iterable[str],
+) -> None:
     """Render a simple categorized Markdown file from scored items.
 
-    Expected item keys: name, url, score, description, categories (list[str]), license, stars, forks
+    Items are hector.models.Item; legacy dicts with the same keys (name, url, score,
+    description, categories, license, stars, forks, ...) are converted on the fly.
+    output_file is a path, or an open text stream that is written to and left open.
     """
-    by_cat: dict[str, list[dict]] = defaultdict(list)
-    for it in items:
-        cats = it.get("categories") or ["Uncategorized"]
-        for c in cats:
-            by_cat[c].append(it)
+    if isinstance(output_file, str | PathLike):
+        with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+            _write_markdown(f, items, categories)
+    else:
+        _write_markdown(output_file, items, categories)
+
+
+def render_markdown_to_str(items: Iterable[Item | dict], categories: Iterable[str]) -> str:
+    """Return the Markdown that render_markdown would write, as one string."""
+    buf = io.StringIO()
+    _write_markdown(buf, items, categories)
+    return buf.getvalue()
+
+
+def _write_markdown(f: TextIO, items: Iterable[Item | dict], categories: Iterable[str]) -> None:
+    entries = [it if isinstance(it, Item) else Item.from_dict(it) for it in items]
+    # One (category, item) pair per assignment, sorted once by (section order, -score)
+    flat = [(c, it) for it in entries for c in (it.categories or ["Uncategorized"])]
 
     # Ensure declared categories appear first, in order
-    ordered_sections: list[str] = [str(c) for c in categories]
-    for c in by_cat.keys():
-        if c not in ordered_sections:
-            ordered_sections.append(c)
-
-    lines: list[str] = ["# Curated Healthcare Technology Tools", ""]
-    for cat in ordered_sections:
-        sect = by_cat.get(cat, [])
-        if not sect:
-            continue
-        lines.append(f"## {cat}")
-        for it in sorted(sect, key=lambda x: x.get("score", 0), reverse=True):
-            name = it.get("name", "repo")
-            url = it.get("url", "")
-            score = round(float(it.get("score", 0)), 2)
-            desc = it.get("description", "").strip()
-            lic = it.get("license", "")
-            stars = int(it.get("stars", 0))
-            forks = int(it.get("forks", 0))
-            lines.append(f"- **[{name}]({url})** (Score: {score})")
-            lines.append(f"  - License: {lic} | Stars: {stars} | Forks: {forks}")
+    declared = [str(c) for c in categories]
+    declared_set = set(declared)
+    extras = [c for c in dict.fromkeys(c for c, _ in flat) if c not in declared_set]
+    ordered_idx: dict[str, int] = {}
+    for i, c in enumerate(declared + extras):
+        ordered_idx.setdefault(c, i)
+
+    # Timsort is stable, so equal scores keep their input order as before
+    flat.sort(key=lambda p: (ordered_idx[p[0]], -float(p[1].score)))
+
+    # Stream sections straight to the output; each section is preceded by a blank line
+    # so the output ends with exactly one newline and needs no post-processing.
+    f.write("# Curated Healthcare Technology Tools\n")
+    for cat, group in groupby(flat, key=itemgetter(0)):
+        f.write(f"\n## {cat}\n")
+        for _, it in group:
+            entry = _ITEM_TMPL.format(
+                name=it.name,
+                url=it.url,
+                score=round(float(it.score), 2),
+                lic=it.license,
+                stars=int(it.stars),
+                forks=int(it.forks),
+            )
             # Optional richer metrics
             extra_parts: list[str] = []
-            if it.get("prs_open") is not None:
-                extra_parts.append(f"PRs open: {int(it.get('prs_open') or 0)}")
-            if it.get("has_discussions") is not None:
-                extra_parts.append(
-                    "Discussions: Yes" if it.get("has_discussions") else "Discussions: No"
-                )
-            if it.get("contributors_count") is not None:
-                extra_parts.append(f"Contributors: {int(it.get('contributors_count') or 0)}")
-            if it.get("days_since_push") is not None:
-                extra_parts.append(f"Last push: {int(it.get('days_since_push') or 0)} days ago")
+            if it.prs_open is not None:
+                extra_parts.append(f"PRs open: {int(it.prs_open or 0)}")
+            if it.has_discussions is not None:
+                extra_parts.append("Discussions: Yes" if it.has_discussions else "Discussions: No")
+            if it.contributors_count is not None:
+                extra_parts.append(f"Contributors: {int(it.contributors_count or 0)}")
+            if it.days_since_push is not None:
+                extra_parts.append(f"Last push: {int(it.days_since_push or 0)} days ago")
             if extra_parts:
-                lines.append("  - " + " | ".join(extra_parts))
+                entry += _EXTRAS_TMPL.format(" | ".join(extra_parts))
+            desc = it.description.strip()
             if desc:
-                lines.append(f"  - Description: {desc}")
-        lines.append("")
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines).rstrip() + "\n")
+                entry += _DESC_TMPL.format(desc)
+            f.write(entry)
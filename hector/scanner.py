@@ -1,6 +1,9 @@
 import logging
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 try:  # Optional dependency guard for dry-run mode
@@ -8,6 +11,29 @@ try:  # Optional dependency guard for dry-run mode
 except Exception:  # pragma: no cover - import-time guard
     Github = None  # type: ignore
 
+try:  # Optional dependency guard for dry-run mode
+    import requests
+except Exception:  # pragma: no cover - import-time guard
+    requests = None  # type: ignore
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Concurrent search queries per wave
+_SEARCH_WORKERS = 4
+
+_PUNCT_RE = re.compile(r"[^a-z0-9\s\-]")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8192)
+def _normalize(text: str) -> str:
+    """Lowercase and normalize for matching (memoized across repos)."""
+    text = text.lower()
+    text = text.replace("&", " and ")
+    text = _PUNCT_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()
+    return text
+
 
 def _build_query(search_cfg: dict[str, Any]) -> str:
     """Build the base search query with topics and common exclusions."""
@@ -118,7 +144,7 @@ def search_repositories(cfg: dict[str, Any], limit: int = 50):
             "PyGithub is required for live scans. Install with 'pip install PyGithub'."
         )
 
-    gh = Github(token, per_page=50)
+    gh = Github(token, per_page=100)
     search_cfg = cfg.get("search", {})
     base_q = _build_query(search_cfg)
     languages = search_cfg.get("languages") or []
@@ -147,11 +173,12 @@ def search_repositories(cfg: dict[str, Any], limit: int = 50):
         return remaining > 0
 
     # 1) Multi-strategy search (with topic batching to avoid overly long queries)
+    # Build the full work-list first: (strategy, topics label, language, query, sort, order)
+    tasks: list[tuple[str, str, str | None, str, Any, Any]] = []
     for strat in _iter_strategies(search_cfg):
-        if remaining <= 0:
-            break
         sort = strat.get("sort") or None
         order = strat.get("order") or None
+        strat_name = strat.get("name", "default")
         q = base_q
         q_extra = (strat.get("query_extra") or "").strip()
         if q_extra:
@@ -169,8 +196,7 @@ def search_repositories(cfg: dict[str, Any], limit: int = 50):
             topic_iter = [topics] if topics else [[]]
 
         for t_batch in topic_iter:
-            if remaining <= 0:
-                break
+            topics_label = ",".join(t_batch) if t_batch else "-"
             if t_batch:
                 # Build query without the giant OR clause, and add a small topic batch
                 topics_clause = " OR ".join([f"topic:{t}" for t in t_batch])
@@ -181,53 +207,56 @@ def search_repositories(cfg: dict[str, Any], limit: int = 50):
 
             if languages:
                 for lang in languages:
-                    if remaining <= 0:
-                        break
                     lang = str(lang).strip()
                     if not lang:
                         continue
                     q_lang = f"{q_effective} language:{lang}".strip()
-                    log.debug(
-                        "GitHub search (strategy=%s, topics=%s, lang=%s): %s",
-                        strat.get("name", "default"),
-                        ",".join(t_batch) if t_batch else "-",
-                        lang,
-                        q_lang,
-                    )
-                    try:
-                        results = gh.search_repositories(q_lang, sort=sort, order=order)
-                    except Exception as e:
-                        log.info(
-                            "Search failed (lang batch). strategy=%s topics=%s error=%s",
-                            strat.get("name", "default"),
-                            ",".join(t_batch) if t_batch else "-",
-                            e,
-                        )
-                        continue
-                    for r in _fetch_pagewise(results, remaining):
-                        if not _add_repo(r):
-                            break
+                    tasks.append((strat_name, topics_label, lang, q_lang, sort, order))
             else:
-                log.debug(
-                    "GitHub search (strategy=%s, topics=%s): %s",
-                    strat.get("name", "default"),
-                    ",".join(t_batch) if t_batch else "-",
-                    q_effective,
-                )
-                try:
-                    results = gh.search_repositories(q_effective, sort=sort, order=order)
-                except Exception as e:
-                    log.info(
-                        "Search failed (no-lang). strategy=%s topics=%s error=%s",
-                        strat.get("name", "default"),
-                        ",".join(t_batch) if t_batch else "-",
-                        e,
-                    )
-                    results = None
-                if results is not None:
-                    for r in _fetch_pagewise(results, remaining):
-                        if not _add_repo(r):
-                            break
+                tasks.append((strat_name, topics_label, None, q_effective, sort, order))
+
+    def _run_search(task: tuple[str, str, str | None, str, Any, Any], want: int) -> list[Any]:
+        strat_name, topics_label, lang, query, sort, order = task
+        if lang:
+            log.debug(
+                "GitHub search (strategy=%s, topics=%s, lang=%s): %s",
+                strat_name,
+                topics_label,
+                lang,
+                query,
+            )
+        else:
+            log.debug("GitHub search (strategy=%s, topics=%s): %s", strat_name, topics_label, query)
+        try:
+            results = gh.search_repositories(query, sort=sort, order=order)
+        except Exception as e:
+            log.info(
+                "Search failed (%s). strategy=%s topics=%s error=%s",
+                "lang batch" if lang else "no-lang",
+                strat_name,
+                topics_label,
+                e,
+            )
+            return []
+        return _fetch_pagewise(results, want)
+
+    # Run queries in small concurrent waves (well under GitHub's secondary rate limit)
+    # and merge each wave in work-list order, so results stay deterministic and at most
+    # one wave is fetched past the limit.
+    with ThreadPoolExecutor(max_workers=_SEARCH_WORKERS) as executor:
+        for start in range(0, len(tasks), _SEARCH_WORKERS):
+            if remaining <= 0:
+                break
+            want = remaining
+            wave = tasks[start : start + _SEARCH_WORKERS]
+            for found in executor.map(lambda t: _run_search(t, want), wave):
+                for r in found:
+                    # A repo already seen from an earlier query is skipped, not a stop
+                    _add_repo(r)
+                    if remaining <= 0:
+                        break
+                if remaining <= 0:
+                    break
 
     # 2) Explicit orgs/users enumeration (best-effort)
     def _iter_repos_from_org(org_name: str):
@@ -331,6 +360,36 @@ def fetch_seed_repos(seed_list: list[str], cfg: dict[str, Any]) -> list[Any]:
     return fetched
 
 
+# Attributes read from repo-likes that do not carry GitHub's raw JSON (dry-run fixtures)
+_RECORD_FIELDS = (
+    "node_id",
+    "full_name",
+    "name",
+    "html_url",
+    "description",
+    "stargazers_count",
+    "forks_count",
+    "open_issues_count",
+    "topics",
+)
+
+
+def repo_fields(repo: Any) -> dict[str, Any]:
+    """Return a plain dict view of a repository in GitHub's REST JSON shape.
+
+    PyGithub objects keep the JSON already returned by search/get_repo in _rawData;
+    reading it directly avoids per-attribute lazy completion requests. Other
+    repo-like objects (dry-run fixtures) are copied attribute by attribute.
+    """
+    raw = getattr(repo, "_rawData", None)
+    if isinstance(raw, dict):
+        return raw
+    record = {f: getattr(repo, f) for f in _RECORD_FIELDS if hasattr(repo, f)}
+    lic = getattr(repo, "license", None)
+    record["license"] = {"spdx_id": getattr(lic, "spdx_id", None)} if lic else None
+    return record
+
+
 def is_repo_healthcare_relevant(repo: Any) -> bool:
     """Check if a repository has healthcare relevance.
 
@@ -340,8 +399,6 @@ def is_repo_healthcare_relevant(repo: Any) -> bool:
     This is a lightweight post-scan filter (Task 5) to discard marginal repos
     that passed the query but aren't actually healthcare-related.
     """
-    import re
-
     # Healthcare context anchors (same list as in categorizer.py Task 3)
     healthcare_anchors = [
         "health",
@@ -359,14 +416,6 @@ def is_repo_healthcare_relevant(repo: Any) -> bool:
         "nurse",
     ]
 
-    def _normalize(text: str) -> str:
-        """Lowercase and normalize for matching."""
-        text = text.lower()
-        text = text.replace("&", " and ")
-        text = re.sub(r"[^a-z0-9\s\-]", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-
     def _has_anchor(text: str) -> bool:
         """Check if text contains any healthcare anchor."""
         normalized = _normalize(text)
@@ -388,34 +437,45 @@ def is_repo_healthcare_relevant(repo: Any) -> bool:
     if _has_anchor(name) or _has_anchor(description):
         return True
 
-    # Check topics if available
+    # Check topics if available; the search payload already includes them, so the
+    # topics endpoint is only hit for repo objects without them
     try:
-        topics = getattr(repo, "get_topics", None)
-        if callable(topics):
-            repo_topics = topics() or []
-            topics_text = " ".join(repo_topics)
-            if _has_anchor(topics_text):
-                return True
+        repo_topics = repo_fields(repo).get("topics")
+        if not isinstance(repo_topics, list):
+            topics = getattr(repo, "get_topics", None)
+            repo_topics = (topics() or []) if callable(topics) else []
+        topics_text = " ".join(repo_topics)
+        if _has_anchor(topics_text):
+            return True
     except Exception:
         pass
 
     return False
 
 
-def get_repo_metrics(repo: Any) -> dict[str, Any]:
+def get_repo_metrics(repo: Any, token: str | None = None) -> dict[str, Any]:
     """Collect richer metrics for a repository, best-effort and lightweight.
 
     Returns keys:
     - prs_open: number of open pull requests
     - has_discussions: whether discussions are enabled
-    - contributors_count: number of contributors (CAPPED AT ~30, first page only)
+    - contributors_count: number of contributors
     - contributors_count_capped: true if contributors_count is limited (Task 9)
     - days_since_push: days since last commit
 
-    Note: contributors_count is limited to the first page (~30) due to API pagination.
-    For repos with many contributors, this underestimates the true count. Set the flag
-    contributors_count_capped to true if the count hit the page limit.
+    Counts come from PaginatedList.totalCount, which requests a single item
+    (per_page=1) and reads the total from the Link header's rel="last" page number.
+    If that is unavailable, contributors_count falls back to the first page (~30)
+    and contributors_count_capped is set when the page was full.
+
+    With a token, all fields are first requested in one GraphQL query (see
+    _METRICS_REPO_QUERY); the REST calls above only run if that fails.
     """
+    if token:
+        metrics_gql = _graphql_repo_metrics(repo, token)
+        if metrics_gql is not None:
+            return metrics_gql
+
     metrics: dict[str, Any] = {
         "prs_open": 0,
         "has_discussions": False,
@@ -444,20 +504,21 @@ def get_repo_metrics(repo: Any) -> dict[str, Any]:
     except Exception:
         pass
 
-    # Contributors count (first page only, max ~30) — Task 9
-    # NOTE: This is a capped value. For repos with many contributors, the true
-    # count is much higher but not fetched to avoid rate-limit overhead.
+    # Contributors count — exact via totalCount, else first page only (Task 9)
     try:
         contribs = repo.get_contributors()
-        first_page = []
-        try:
-            first_page = contribs.get_page(0)
-        except Exception:
+        total = getattr(contribs, "totalCount", None)
+        if total is not None:
+            metrics["contributors_count"] = int(total)
+        else:
             first_page = []
-        c = len(first_page)
-        # Mark as capped if we got a full page (indicates more exist)
-        metrics["contributors_count"] = int(c)
-        metrics["contributors_count_capped"] = len(first_page) >= 30
+            try:
+                first_page = contribs.get_page(0)
+            except Exception:
+                first_page = []
+            # Mark as capped if we got a full page (indicates more exist)
+            metrics["contributors_count"] = len(first_page)
+            metrics["contributors_count_capped"] = len(first_page) >= 30
     except Exception:
         pass
 
@@ -472,3 +533,117 @@ def get_repo_metrics(repo: Any) -> dict[str, Any]:
         pass
 
     return metrics
+
+
+_METRICS_BATCH_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on Repository {
+      id
+      pullRequests(states: OPEN) { totalCount }
+      hasDiscussionsEnabled
+      mentionableUsers { totalCount }
+      pushedAt
+    }
+  }
+}
+"""
+
+
+_METRICS_REPO_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN) { totalCount }
+    hasDiscussionsEnabled
+    mentionableUsers { totalCount }
+    pushedAt
+  }
+}
+"""
+
+
+def _days_since_iso(ts: str | None) -> int | None:
+    if not ts:
+        return None
+    pushed_at = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    return int((datetime.now(timezone.utc) - pushed_at).days)
+
+
+def _metrics_from_node(node: dict[str, Any]) -> dict[str, Any]:
+    """Map a GraphQL Repository node onto the get_repo_metrics dict shape."""
+    return {
+        "prs_open": int((node.get("pullRequests") or {}).get("totalCount") or 0),
+        "has_discussions": bool(node.get("hasDiscussionsEnabled")),
+        "contributors_count": int((node.get("mentionableUsers") or {}).get("totalCount") or 0),
+        "contributors_count_capped": False,
+        "days_since_push": _days_since_iso(node.get("pushedAt")),
+    }
+
+
+def _graphql_repo_metrics(repo: Any, token: str) -> dict[str, Any] | None:
+    """Fetch one repo's metrics in a single GraphQL request; None if unavailable."""
+    if requests is None:
+        return None
+    full_name = repo_fields(repo).get("full_name") or ""
+    owner, _, name = str(full_name).partition("/")
+    if not owner or not name:
+        return None
+    try:
+        resp = requests.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": _METRICS_REPO_QUERY, "variables": {"owner": owner, "name": name}},
+            headers={"Authorization": f"bearer {token}"},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        node = (resp.json().get("data") or {}).get("repository")
+        return _metrics_from_node(node) if node else None
+    except Exception as e:
+        logging.getLogger("hector").debug("GraphQL metrics failed for %s: %s", full_name, e)
+        return None
+
+
+def get_repos_metrics_batched(
+    repos: list[Any], token: str | None, batch_size: int = 100
+) -> list[dict[str, Any] | None]:
+    """Collect get_repo_metrics-shaped dicts for many repos via GraphQL `nodes(ids:)`.
+
+    One HTTP request covers up to 100 repositories instead of ~3 REST calls per repo.
+    contributors_count uses mentionableUsers as a proxy, which is not capped.
+
+    Returns a list aligned with `repos`; entries are None when a repo has no node_id
+    or its batch failed, so callers can fall back to get_repo_metrics for those.
+    A failed batch stops the remaining ones: under an outage or rate limit they
+    would fail the same way.
+    """
+    results: list[dict[str, Any] | None] = [None] * len(repos)
+    if not token or requests is None:
+        return results
+
+    log = logging.getLogger("hector")
+    headers = {"Authorization": f"bearer {token}"}
+    indexed = [(i, repo_fields(r).get("node_id")) for i, r in enumerate(repos)]
+    indexed = [(i, nid) for i, nid in indexed if nid]
+
+    for start in range(0, len(indexed), batch_size):
+        chunk = indexed[start : start + batch_size]
+        try:
+            resp = requests.post(
+                GITHUB_GRAPHQL_URL,
+                json={"query": _METRICS_BATCH_QUERY, "variables": {"ids": [n for _, n in chunk]}},
+                headers=headers,
+                timeout=30,
+            )
+            resp.raise_for_status()
+            nodes = (resp.json().get("data") or {}).get("nodes") or []
+        except Exception as e:
+            log.info("GraphQL metrics batch failed; falling back to REST. error=%s", e)
+            break
+        for (i, _), node in zip(chunk, nodes):
+            if not node:
+                continue
+            try:
+                results[i] = _metrics_from_node(node)
+            except Exception:
+                continue
+    return results
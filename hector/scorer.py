@@ -1,5 +1,10 @@
 import re
-from typing import Any
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+_PUNCT_RE = re.compile(r"[^a-z0-9\s\-]")
+_WS_RE = re.compile(r"\s+")
 
 # Healthcare context anchors for relevance boost (Task 8)
 _HEALTHCARE_ANCHORS: list[str] = [
@@ -19,19 +24,27 @@ _HEALTHCARE_ANCHORS: list[str] = [
 ]
 
 
+def _field(repo: Any, attr: str, default: Any = None) -> Any:
+    """Read a field from a plain dict (GitHub JSON shape) or a repo-like object."""
+    if isinstance(repo, dict):
+        return repo.get(attr, default)
+    return getattr(repo, attr, default)
+
+
 def _get(repo: Any, attr: str, default: float = 0.0) -> float:
     try:
-        return float(getattr(repo, attr))
+        return float(_field(repo, attr))
     except Exception:
         return float(default)
 
 
+@lru_cache(maxsize=8192)
 def _normalize(text: str) -> str:
     """Lowercase and normalize text for matching."""
     text = text.lower()
     text = text.replace("&", " and ")
-    text = re.sub(r"[^a-z0-9\s\-]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _PUNCT_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
@@ -52,35 +65,77 @@ def _is_healthcare_relevant(text: str) -> bool:
 
 def _license_id(repo: Any) -> str:
     try:
-        lic = getattr(repo, "license", None)
-        if lic and getattr(lic, "spdx_id", None):
-            return lic.spdx_id  # type: ignore[attr-defined]
+        lic = _field(repo, "license")
+        spdx_id = _field(lic, "spdx_id") if lic else None
+        if spdx_id:
+            return spdx_id
     except Exception:
         pass
     return "none"
 
 
+class WeightVec(NamedTuple):
+    """Scoring weights coerced to floats once per config (see compile_weights)."""
+
+    stars: float
+    forks: float
+    issues: float
+    prs: float
+    disc: float
+    contrib: float
+    recency: float
+    health_relevance: float
+    license_map: dict[str, Any]
+
+
+def compile_weights(weights: dict[str, Any]) -> WeightVec:
+    """Resolve the weights config into a WeightVec, so scoring is multiplication only."""
+    return WeightVec(
+        stars=float(weights.get("stars", 0)),
+        forks=float(weights.get("forks", 0)),
+        issues=float(weights.get("open_issues", 0)),
+        prs=float(weights.get("prs", 0)),
+        disc=float(weights.get("discussions", 0)),
+        contrib=float(weights.get("contributors", 0)),
+        recency=float(weights.get("recency_decay", 0)),
+        health_relevance=float(weights.get("health_relevance_boost", 0)),
+        license_map=weights.get("license", {}) or {},
+    )
+
+
 def score_repository(
-    repo: Any, weights: dict[str, Any], metrics: dict[str, Any] | None = None
+    repo: Any, weights: dict[str, Any] | WeightVec, metrics: Mapping[str, Any] | None = None
 ) -> float:
     """Compute a score for a repository based on weights config.
 
+    repo may be a PyGithub Repository, any object with the same attributes, or a
+    plain dict in GitHub's REST JSON shape (see scanner.repo_fields).
+    Accepts the raw weights mapping or a WeightVec from compile_weights; callers
+    scoring many repos should compile once up front.
     Includes optional healthcare domain relevance boost (Task 8).
     """
-    stars_w = float(weights.get("stars", 0))
-    forks_w = float(weights.get("forks", 0))
-    issues_w = float(weights.get("open_issues", 0))
-    prs_w = float(weights.get("prs", 0))
-    disc_w = float(weights.get("discussions", 0))
-    contrib_w = float(weights.get("contributors", 0))
-    recency_w = float(weights.get("recency_decay", 0))
-    health_relevance_w = float(weights.get("health_relevance_boost", 0))
+    w = weights if isinstance(weights, WeightVec) else compile_weights(weights)
 
     stars = _get(repo, "stargazers_count", 0)
     forks = _get(repo, "forks_count", 0)
     open_issues = _get(repo, "open_issues_count", 0)
+    prs, discussions, contributors, recency_term = _metric_terms(metrics)
+
+    base = (
+        stars * w.stars
+        + forks * w.forks
+        + open_issues * w.issues
+        + prs * w.prs
+        + discussions * w.disc
+        + contributors * w.contrib
+        + recency_term * w.recency
+    )
 
-    # Use provided metrics if available
+    return float(base + _license_bonus(repo, w) + _health_boost(repo, w))
+
+
+def _metric_terms(metrics: Mapping[str, Any] | None) -> tuple[float, float, float, float]:
+    """Return (prs, discussions, contributors, recency_term) from optional metrics."""
     prs = 0.0
     discussions = 0.0
     contributors = 0.0
@@ -93,27 +148,36 @@ def score_repository(
         if days_since_push is not None:
             # Negative contribution increases with staleness; approx per month
             recency_term = -float(days_since_push) / 30.0
+    return prs, discussions, contributors, recency_term
 
-    base = (
-        stars * stars_w
-        + forks * forks_w
-        + open_issues * issues_w
-        + prs * prs_w
-        + discussions * disc_w
-        + contributors * contrib_w
-        + recency_term * recency_w
-    )
 
-    # Healthcare relevance boost (Task 8)
-    health_relevance_boost = 0.0
-    if health_relevance_w > 0:
-        name = getattr(repo, "full_name", getattr(repo, "name", "")) or ""
-        description = getattr(repo, "description", "") or ""
+def _health_boost(repo: Any, w: WeightVec) -> float:
+    """Healthcare relevance boost (Task 8)."""
+    if w.health_relevance > 0:
+        name = _field(repo, "full_name", _field(repo, "name", "")) or ""
+        description = _field(repo, "description", "") or ""
         combined_text = f"{name} {description}"
         if _is_healthcare_relevant(combined_text):
-            health_relevance_boost = health_relevance_w
+            return w.health_relevance
+    return 0.0
 
-    lic_map = weights.get("license", {}) or {}
-    bonus = float(lic_map.get(_license_id(repo), lic_map.get("none", 0)))
 
-    return float(base + bonus + health_relevance_boost)
+def _license_bonus(repo: Any, w: WeightVec) -> float:
+    lic_map = w.license_map
+    return float(lic_map.get(_license_id(repo), lic_map.get("none", 0)))
+
+
+def score_repositories(
+    repos: Sequence[Any],
+    weights: dict[str, Any] | WeightVec,
+    metrics_list: Sequence[Mapping[str, Any] | None] | None = None,
+) -> list[float]:
+    """Score many repositories at once; same results as score_repository per repo.
+
+    The weights are compiled once for the whole batch, so each repo costs only the
+    attribute reads and the weighted sum.
+    """
+    w = weights if isinstance(weights, WeightVec) else compile_weights(weights)
+    if metrics_list is None:
+        return [score_repository(r, w) for r in repos]
+    return [score_repository(r, w, m) for r, m in zip(repos, metrics_list)]
@@ -5,13 +5,33 @@ import json
 import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 
-from hector import scanner
-from hector.categorizer import categorize_repository
+from hector.categorizer import CategoryMatcher, build_matcher, categorize_repository
 from hector.config import load_config
+from hector.models import Item
 from hector.renderer import render_markdown
-from hector.scorer import score_repository
+from hector.scorer import compile_weights, score_repositories
+
+# hector.scanner (PyGithub, requests) is imported inside main() once the --help,
+# --categories-only and empty --dry-run exits are behind us.
+
+
+@lru_cache(maxsize=1)
+def _rate_limit_errors() -> tuple:
+    """Exceptions that abort the concurrent topics fetch (empty when PyGithub is absent).
+
+    Only evaluated when an exception is being handled, so PyGithub is not imported
+    for runs that never hit an error.
+    """
+    try:
+        from github import RateLimitExceededException
+    except Exception:  # pragma: no cover - import-time guard
+        return ()
+    return (RateLimitExceededException,)
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -68,7 +88,7 @@ def _resolve_output_paths(cfg: dict, cli_output: str | None) -> tuple[str, str |
         return cli_output, latest_path
 
     file_tmpl = out_cfg.get("file", "healthtech-tools.md")
-    today = datetime.utcnow().strftime("%Y-%m-%d")
+    today = time.strftime("%Y-%m-%d", time.gmtime())
     out_file = str(file_tmpl).replace("{date}", today)
     return out_file, latest_path
 
@@ -158,6 +178,19 @@ def _load_repos_from_markdown(md_path: str) -> list[dict]:
     return repos
 
 
+# Directories already created (or found to exist) during this run
+_MADE_DIRS: set[str] = set()
+
+
+def _ensure_dir(d: str) -> None:
+    """Create directory d (and any missing parents) at most once per process."""
+    if not d or d in _MADE_DIRS:
+        return
+    # Still raises FileExistsError when d exists but is not a directory
+    os.makedirs(d, exist_ok=True)
+    _MADE_DIRS.add(d)
+
+
 def _write_run_summary(summary_path: str, stats: dict, items: list, log: logging.Logger) -> None:
     """Write a run summary JSON file with pipeline statistics.
 
@@ -171,7 +204,7 @@ def _write_run_summary(summary_path: str, stats: dict, items: list, log: logging
     category_counts: dict[str, int] = {}
     uncategorized_count = 0
     for item in items:
-        cats = item.get("categories", ["Uncategorized"])  # type: ignore[union-attr]
+        cats = item.categories
         if not cats or (len(cats) == 1 and cats[0] == "Uncategorized"):
             uncategorized_count += 1
         else:
@@ -195,9 +228,7 @@ def _write_run_summary(summary_path: str, stats: dict, items: list, log: logging
     }
 
     # Ensure output directory exists
-    summary_dir = os.path.dirname(summary_path)
-    if summary_dir:
-        os.makedirs(summary_dir, exist_ok=True)
+    _ensure_dir(os.path.dirname(summary_path))
 
     with open(summary_path, "w") as f:
         json.dump(summary, f, indent=2)
@@ -219,6 +250,97 @@ def _write_run_summary(summary_path: str, stats: dict, items: list, log: logging
             log.info("    %s: %d", cat, category_counts[cat])
 
 
+def _fetch_topics(r, *, fail_fast: bool = False) -> list[str]:
+    """Best-effort topics from the topics endpoint; [] when unavailable.
+
+    With fail_fast, a GitHub rate-limit error propagates instead of being treated
+    as "no topics", so the caller can retry serially.
+    """
+    try:
+        get_topics = getattr(r, "get_topics", None)
+        return (get_topics() or []) if callable(get_topics) else []
+    except _rate_limit_errors():
+        if fail_fast:
+            raise
+        return []
+    except Exception:
+        return []
+
+
+def _repo_topics(
+    repos: list, records: list[dict], concurrency: int, log: logging.Logger
+) -> list[list[str]]:
+    """Topics for each repo: from its record, else from the topics endpoint.
+
+    Search and get_repo payloads already carry topics, so only the remaining repos
+    hit the endpoint; those blocking calls are overlapped across threads. A rate
+    limit aborts the pool and the fetches are redone serially.
+    """
+    raw = [rec.get("topics") for rec in records]
+    topics: list[list[str]] = [t if isinstance(t, list) else [] for t in raw]
+    missing = [i for i, t in enumerate(raw) if not isinstance(t, list)]
+    if missing:
+        targets = [repos[i] for i in missing]
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                fetched = list(executor.map(partial(_fetch_topics, fail_fast=True), targets))
+        except _rate_limit_errors():
+            log.warning("GitHub rate limit hit; fetching repository topics serially")
+            fetched = [_fetch_topics(r) for r in targets]
+        for i, t in zip(missing, fetched):
+            topics[i] = t
+    return topics
+
+
+def _process_repo(
+    record: dict,
+    repo_topics: list[str],
+    metrics: dict,
+    cats_config: list[str],
+    require_health_context: bool,
+    matcher: CategoryMatcher,
+) -> Item | None:
+    """Categorize one repository into an unscored Item, or None if it cannot be read.
+
+    Fields come from record (scanner.repo_fields); repo_topics from _repo_topics.
+    """
+    try:
+        name = record.get("full_name", record.get("name", "unknown"))
+        url = record.get("html_url", "")
+        desc = record.get("description", "") or ""
+        # Include repo topics to improve categorization recall
+        desc_for_cat = (desc + " " + " ".join(repo_topics)).strip()
+        cats = categorize_repository(
+            name,
+            desc_for_cat,
+            cats_config,
+            require_health_context=require_health_context,
+            matcher=matcher,
+        )
+        lic = (record.get("license") or {}).get("spdx_id") or "none"
+        stars = int(record.get("stargazers_count", 0) or 0)
+        forks = int(record.get("forks_count", 0) or 0)
+        return Item(
+            name=name,
+            url=url,
+            score=0.0,  # filled in by score_repositories
+            description=desc,
+            categories=tuple(cats or ["Uncategorized"]),
+            license=lic,
+            stars=stars,
+            forks=forks,
+            # extra metrics for renderer
+            prs_open=metrics.get("prs_open"),
+            has_discussions=metrics.get("has_discussions"),
+            contributors_count=metrics.get("contributors_count"),
+            contributors_count_capped=metrics.get("contributors_count_capped"),
+            days_since_push=metrics.get("days_since_push"),
+        )
+    except Exception as e:
+        logging.getLogger("hector").warning("Skipping repository due to error: %s", e)
+        return None
+
+
 def main(argv: list[str]) -> int:
     args = parse_args(argv)
     setup_logging(args.log_level)
@@ -252,17 +374,19 @@ def main(argv: list[str]) -> int:
                 "require_health_context", True
             )
 
-            items = []
+            cat_matcher = build_matcher(cat_categories, cat_kw)
+
+            items: list[Item] = []
             for repo_info in repos_data:
                 cats = categorize_repository(
                     repo_info["full_name"],
                     repo_info.get("description", ""),
                     cat_categories,
-                    cat_kw,
-                    cat_require_health,
+                    require_health_context=cat_require_health,
+                    matcher=cat_matcher,
                 )
-                repo_info["categories"] = cats or ["Uncategorized"]
-                items.append(repo_info)
+                repo_info["categories"] = tuple(cats or ["Uncategorized"])
+                items.append(Item.from_dict(repo_info))
 
             log.info("Re-categorized %d repos", len(items))
 
@@ -292,7 +416,10 @@ def main(argv: list[str]) -> int:
         except Exception as e:
             log.error("Failed to load fixture: %s", e)
             return 1
-    else:
+
+    from hector import scanner
+
+    if not args.dry_run:
         limit = int(args.limit)
         log.info("Searching repositories... limit=%s", limit)
         repos = scanner.search_repositories(cfg, limit=limit)
@@ -304,7 +431,11 @@ def main(argv: list[str]) -> int:
     min_stars = int(cfg.get("search", {}).get("min_stars", 0) or 0)
     if min_stars > 0:
         original_count = len(repos)
-        repos = [r for r in repos if int(getattr(r, "stargazers_count", 0) or 0) >= min_stars]
+        repos = [
+            r
+            for r in repos
+            if int(scanner.repo_fields(r).get("stargazers_count", 0) or 0) >= min_stars
+        ]
         filtered_count = original_count - len(repos)
         log.info(
             "Applied min_stars=%d filter: %d repos → %d repos (filtered %d)",
@@ -348,57 +479,56 @@ def main(argv: list[str]) -> int:
             log.info("seed_repos: added %d new repos (total now %d)", added, len(repos))
     stats["after_seed_merge"] = len(repos)
 
+    # Read every field from the JSON the search/get_repo calls already returned
+    records = [scanner.repo_fields(r) for r in repos]
+
     weights: dict = cfg.get("weights", {})
+    weight_vec = compile_weights(weights)
     cats_config: list[str] = cfg.get("output", {}).get("categories", [])
     cat_keywords: dict = cfg.get("category_keywords") or cfg.get("output", {}).get(
         "category_keywords", {}
     )
     require_health_context: bool = cfg.get("categorizer", {}).get("require_health_context", True)
-
+    matcher = build_matcher(cats_config, cat_keywords)
+    concurrency = max(1, int(cfg.get("scan", {}).get("concurrency", 8) or 1))
+
+    # Metrics: one GraphQL request per 100 repos when live, REST for anything it missed.
+    # Dry runs never touch the network, so no token is handed to the metrics helpers.
+    token = None if args.dry_run else cfg.get("auth", {}).get("GITHUB_TOKEN")
+    all_metrics: list = [None] * len(repos)
+    if token:
+        all_metrics = scanner.get_repos_metrics_batched(repos, token)
+    missing = [i for i, m in enumerate(all_metrics) if m is None]
+    if missing:
+        # Whatever the batch missed (failed request, unresolvable node) would fail a
+        # per-repo GraphQL query too, so no token is passed and these go straight to
+        # REST. The REST calls block on HTTP; overlap them across repos.
+        # get_repo_metrics is best-effort and never raises.
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            fetched = executor.map(scanner.get_repo_metrics, [repos[i] for i in missing])
+            for i, m in zip(missing, fetched):
+                all_metrics[i] = m
+
+    # Categorization is CPU-bound and runs serially; only the topics fallback does I/O
+    topics = _repo_topics(repos, records, concurrency, log)
+    processed = [
+        _process_repo(rec, t, m, cats_config, require_health_context, matcher)
+        for rec, t, m in zip(records, topics, all_metrics)
+    ]
+
+    # Score the whole batch with the weights compiled once
     items = []
-    for r in repos:
-        try:
-            name = getattr(r, "full_name", getattr(r, "name", "unknown"))
-            url = getattr(r, "html_url", "")
-            desc = getattr(r, "description", "") or ""
-            # Best-effort: include repo topics to improve categorization recall
-            repo_topics: list[str] = []
-            try:
-                get_topics = getattr(r, "get_topics", None)
-                if callable(get_topics):
-                    repo_topics = get_topics() or []
-            except Exception:
-                repo_topics = []
-            desc_for_cat = (desc + " " + " ".join(repo_topics)).strip()
-            metrics = scanner.get_repo_metrics(r)
-            score = score_repository(r, weights, metrics)
-            cats = categorize_repository(
-                name, desc_for_cat, cats_config, cat_keywords, require_health_context
-            )
-            lic = getattr(getattr(r, "license", None), "spdx_id", None) or "none"
-            stars = int(getattr(r, "stargazers_count", 0) or 0)
-            forks = int(getattr(r, "forks_count", 0) or 0)
-            items.append(
-                {
-                    "name": name,
-                    "url": url,
-                    "score": score,
-                    "description": desc,
-                    "categories": cats or ["Uncategorized"],
-                    "license": lic,
-                    "stars": stars,
-                    "forks": forks,
-                    # extra metrics for renderer
-                    "prs_open": metrics.get("prs_open"),
-                    "has_discussions": metrics.get("has_discussions"),
-                    "contributors_count": metrics.get("contributors_count"),
-                    "contributors_count_capped": metrics.get("contributors_count_capped"),
-                    "days_since_push": metrics.get("days_since_push"),
-                }
-            )
-        except Exception as e:
-            log.warning("Skipping repository due to error: %s", e)
-            continue
+    scored_records: list[dict] = []
+    metrics_list: list[dict] = []
+    for rec, metrics, item in zip(records, all_metrics, processed):
+        if item is not None:
+            items.append(item)
+            scored_records.append(rec)
+            metrics_list.append(metrics)
+
+    scores = score_repositories(scored_records, weight_vec, metrics_list)
+    for item, score in zip(items, scores):
+        item.score = score
 
     # Apply score floor filter (Task 6)
     min_score_cfg = cfg.get("output", {}).get("min_score")
@@ -407,7 +537,7 @@ def main(argv: list[str]) -> int:
         original_count = len(items)
         filtered_items = []
         for item in items:
-            score = item.get("score")  # type: ignore[assignment]
+            score = item.score
             try:
                 score_val = float(score) if score is not None else 0.0
                 if score_val >= min_score:
@@ -435,9 +565,7 @@ def main(argv: list[str]) -> int:
     if keep_dated:
         paths_to_prepare.append(output_file)
     for p in paths_to_prepare:
-        d = os.path.dirname(p)
-        if d:
-            os.makedirs(d, exist_ok=True)
+        _ensure_dir(os.path.dirname(p))
 
     if not items:
         log.info("No repositories processed; writing an empty curated list stub")
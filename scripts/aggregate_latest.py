@@ -1,31 +1,32 @@
 #!/usr/bin/env python3
 import argparse
-import glob
 import os
 import re
-from datetime import datetime
+import shutil
+from datetime import date
+
+_DATED_NAME_RE = re.compile(r"healthtech-tools-(\d{4}-\d{2}-\d{2})\.md")
+
+
+def _is_dated_name(name: str) -> bool:
+    m = _DATED_NAME_RE.fullmatch(name)
+    if not m:
+        return False
+    try:
+        date.fromisoformat(m.group(1))  # rejects impossible dates such as 2024-02-31
+    except ValueError:
+        return False
+    return True
 
 
 def find_latest_dated_file(directory: str) -> str | None:
-    pattern = os.path.join(directory, "healthtech-tools-*.md")
-    candidates = glob.glob(pattern)
-    if not candidates:
-        return None
-    rx = re.compile(r"healthtech-tools-(\d{4}-\d{2}-\d{2})\.md$")
-    dated = []
-    for p in candidates:
-        m = rx.search(os.path.basename(p))
-        if not m:
-            continue
-        try:
-            dt = datetime.strptime(m.group(1), "%Y-%m-%d")
-        except ValueError:
-            continue
-        dated.append((dt, p))
-    if not dated:
+    # ISO dates sort lexicographically, so the newest file is simply the max name
+    try:
+        with os.scandir(directory) as it:
+            candidates = [e for e in it if _is_dated_name(e.name)]
+    except FileNotFoundError:
         return None
-    dated.sort(key=lambda x: x[0])
-    return dated[-1][1]
+    return max(candidates, key=lambda e: e.name).path if candidates else None
 
 
 essage = """
@@ -57,10 +58,14 @@ def main():
         print(f"No dated files found in {target_dir}. Wrote empty stub to {output_path}")
         return
 
-    with open(latest_file, encoding="utf-8") as src:
-        content = src.read()
-    with open(output_path, "w", encoding="utf-8") as dst:
-        dst.write(content)
+    try:
+        # Kernel-side copy (copy_file_range/sendfile); bytes never enter Python
+        shutil.copyfile(latest_file, output_path)
+    except OSError:
+        with open(latest_file, encoding="utf-8") as src:
+            content = src.read()
+        with open(output_path, "w", encoding="utf-8") as dst:
+            dst.write(content)
     print(f"Aggregated {os.path.basename(latest_file)} -> {output_path}")
 
 
@@ -9,39 +9,74 @@ Outputs:
 Shields schema: https://shields.io/endpoint
 {"schemaVersion":1,"label":"Hector Score","message":"123.4","color":"green"}
 """
+
 from __future__ import annotations
 
 import json
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
+try:  # Optional accelerator: C JSON encoder returning bytes (pip install orjson)
+    import orjson
+except Exception:  # pragma: no cover - import-time guard
+    orjson = None  # type: ignore
+
 ROOT = Path(__file__).resolve().parents[1]
 RESULT_LATEST = ROOT / "result" / "healthtech-tools.md"
 DOCS_DIR = ROOT / "docs"
 BADGES_DIR = DOCS_DIR / "badges"
+# Fallback slug from the item name when the URL is not a github.com repo
+_NAME_SLUG_RE = re.compile(r"[^A-Za-z0-9_]+")
 
 RE_ITEM = re.compile(
     # - **[org/repo](https://github.com/org/repo)** (Score: 123.45)
-    r"^\s*- \*\*\[(?P<name>[^\]]+)\]\((?P<url>[^\)]+)\)\*\* \(Score: (?P<score>[-0-9.]+)\)",
-    re.IGNORECASE,
+    # Bytes pattern scanned over the whole file; fields never span lines
+    rb"^[ \t]*- \*\*\[(?P<name>[^\]\n]+)\]\((?P<url>[^\)\n]+)\)\*\* \(Score: (?P<score>[-0-9.]+)\)",
+    re.IGNORECASE | re.MULTILINE,
 )
 
 
+# Lower bounds of each color band, ascending; _COLORS[i] covers [_THRESHOLDS[i-1], _THRESHOLDS[i])
+_THRESHOLDS = (10, 50, 100, 200, 500)
+_COLORS = ("lightgrey", "orange", "yellow", "yellowgreen", "green", "brightgreen")
+
+
+# Parallel badge compare-and-writes; each is a small independent file and file I/O
+# releases the GIL
+_WRITE_WORKERS = 32
+
+
+def _dumps(obj: dict) -> bytes:
+    """Compact JSON bytes; the stdlib fallback emits exactly what orjson does."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 def _color_for_score(score: float) -> str:
-    if score >= 500:
-        return "brightgreen"
-    if score >= 200:
-        return "green"
-    if score >= 100:
-        return "yellowgreen"
-    if score >= 50:
-        return "yellow"
-    if score >= 10:
-        return "orange"
-    return "lightgrey"
+    return _COLORS[bisect_right(_THRESHOLDS, score)]
+
+
+def _write_if_changed(path: Path, body: bytes) -> bool:
+    """Write body to path unless the file already holds exactly these bytes.
+
+    Comparing against the file on disk (not a record of earlier runs) also repairs
+    badges changed by anything else, e.g. a git checkout or a manual edit.
+    """
+    try:
+        if path.read_bytes() == body:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(body)
+    return True
 
 
+@lru_cache(maxsize=4096)
 def _slug_from_url(url: str) -> str | None:
     try:
         p = urlparse(url)
@@ -60,16 +95,13 @@ def parse_results(md_path: Path) -> list[tuple[str, str, float]]:
     items: list[tuple[str, str, float]] = []
     if not md_path.exists():
         return items
-    for line in md_path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        m = RE_ITEM.match(line)
-        if not m:
-            continue
-        url = m.group("url").strip()
-        name = m.group("name").strip()
+    for m in RE_ITEM.finditer(md_path.read_bytes()):
         try:
-            score = float(m.group("score"))
-        except Exception:
+            score = float(m["score"])
+        except ValueError:
             continue
+        name = m["name"].decode("utf-8", errors="ignore").strip()
+        url = m["url"].decode("utf-8", errors="ignore").strip()
         items.append((name, url, score))
     return items
 
@@ -86,26 +118,32 @@ def main() -> int:
         "message": f"{len(items)} projects",
         "color": "blue",
     }
-    (DOCS_DIR / "badge.json").write_text(json.dumps(global_badge), encoding="utf-8")
-
-    # Per-project badges
-    for name, url, score in items:
-        slug = _slug_from_url(url)
-        if not slug:
-            # Fallback slug from name
-            slug = re.sub(r"[^A-Za-z0-9_]+", "_", name)
-        badge = {
-            "schemaVersion": 1,
-            "label": "Hector Score",
-            "message": f"{score:.2f}",
-            "color": _color_for_score(score),
-        }
-        (BADGES_DIR / f"{slug}.json").write_text(json.dumps(badge), encoding="utf-8")
+    (DOCS_DIR / "badge.json").write_bytes(_dumps(global_badge))
+
+    # Per-project badges, built column-wise: slugs first, then one encode per unique
+    # slug. Repos listed under several categories are encoded once; the last
+    # occurrence wins, as when each one overwrote the file.
+    names, urls, scores = zip(*items) if items else ((), (), ())
+    slugs = [_slug_from_url(u) or _NAME_SLUG_RE.sub("_", n) for n, u in zip(names, urls)]
+    last = {slug: i for i, slug in enumerate(slugs)}
+    unique_scores = [scores[i] for i in last.values()]
+    # One template dict mutated in place, so every encode sees the same shape
+    badge = {"schemaVersion": 1, "label": "Hector Score", "message": "", "color": ""}
+    badges: dict[str, bytes] = {}
+    for slug, score in zip(last, unique_scores):
+        badge["message"] = f"{score:.2f}"
+        badge["color"] = _color_for_score(score)
+        badges[slug] = _dumps(badge)
+
+    # Only rewrite badges whose file is missing or holds different bytes
+    paths = [BADGES_DIR / f"{slug}.json" for slug in badges]
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+        written = sum(executor.map(_write_if_changed, paths, badges.values()))
 
     # No Jekyll to allow paths with underscores
     (DOCS_DIR / ".nojekyll").write_text("", encoding="utf-8")
 
-    print(f"Wrote {len(items)} project badges and global badge to {DOCS_DIR}")
+    print(f"Wrote {written} of {len(badges)} project badges and global badge to {DOCS_DIR}")
     return 0
 
 
@@ -1,110 +1,100 @@
 #!/usr/bin/env python3
 import argparse
+import mmap
+import os
 import re
+from pathlib import Path
+from typing import cast
 
-from hector.categorizer import categorize_repository
+from hector.categorizer import build_matcher, categorize_repository
 from hector.config import load_config
-from hector.renderer import render_markdown
-
-HEADER_RE = re.compile(
-    r"^- \*\*\[(?P<name>.+?)\]\((?P<url>.+?)\)\*\* \(Score: (?P<score>[-\d\.]+)\)"
-)
-LICENSE_RE = re.compile(
-    r"^\s*- License: (?P<license>[^|]+)\| Stars: (?P<stars>\d+) \| Forks: (?P<forks>\d+)"
+from hector.renderer import render_markdown_to_str
+
+# One entry as written by hector.renderer: header, license line, then optional
+# metrics and description lines. Every metrics part is optional, so the metrics line
+# may start with any of them. A single finditer pass parses the whole file.
+_ITEM_PATTERN = (
+    r"^- \*\*\[(?P<name>.+?)\]\((?P<url>.+?)\)\*\* \(Score: (?P<score>[-\d\.]+)\).*\n?"
+    r"(?:[ \t]*- License: (?P<license>[^|\n]+)"
+    r"\| Stars: (?P<stars>\d+) \| Forks: (?P<forks>\d+).*\n?)?"
+    r"(?:[ \t]*- (?=PRs open: |Discussions: |Contributors: |Last push: )"
+    r"(?:PRs open: (?P<prs>\d+))?"
+    r"(?:(?: \| )?Discussions: (?P<disc>\w+))?"
+    r"(?:(?: \| )?Contributors: (?P<contrib>\d+))?"
+    r"(?:(?: \| )?Last push: (?P<push>\d+) days ago)?.*\n?)?"
+    r"(?:[ \t]*- Description: (?P<desc>.+)\n?)?"
 )
-EXTRA_RE = re.compile(r"^\s*- (?P<parts>.+)$")
-DESC_RE = re.compile(r"^\s*- Description: (?P<desc>.+)$")
-
-
-def parse_items(lines: list[str]) -> list[dict]:
-    items: list[dict] = []
-    current: dict | None = None
-
-    def commit():
-        nonlocal current
-        if current is not None:
-            items.append(current)
-            current = None
-
-    for raw in lines:
-        line = raw.rstrip("\n")
-        if line.startswith("# ") or line.startswith("## ") or not line.strip():
-            # section headers and blanks are ignored for parsing items
-            continue
-        m = HEADER_RE.match(line)
-        if m:
-            commit()
-            current = {
-                "name": m.group("name").strip(),
-                "url": m.group("url").strip(),
-                "score": float(m.group("score")),
-                "license": "",
-                "stars": 0,
-                "forks": 0,
-                "prs_open": None,
-                "has_discussions": None,
-                "contributors_count": None,
-                "days_since_push": None,
-                "description": "",
-            }
-            continue
-        if current is None:
-            continue
-        m = LICENSE_RE.match(line.replace("  - ", "- "))
-        if m:
-            current["license"] = m.group("license").strip()
-            current["stars"] = int(m.group("stars"))
-            current["forks"] = int(m.group("forks"))
-            continue
-        if line.strip().startswith("- PRs open:"):
-            # Normalize the indent for regex
-            parts = [p.strip() for p in line.split(":", 1)[1].split("|")]
-            # Fallback: use a simple parse to avoid overfitting regex
-            try:
-                prs_part = parts[0].strip()
-                current["prs_open"] = int(prs_part)
-            except Exception:
-                pass
-            for p in parts[1:]:
-                p = p.strip()
-                if p.lower().startswith("discussions:"):
-                    val = p.split(":", 1)[1].strip().lower()
-                    current["has_discussions"] = True if val.startswith("yes") else False
-                elif p.lower().startswith("contributors:"):
-                    try:
-                        current["contributors_count"] = int(p.split(":", 1)[1].strip())
-                    except Exception:
-                        pass
-                elif p.lower().startswith("last push:") and p.lower().endswith("days ago"):
-                    num = p.split(":", 1)[1].strip().split(" ")[0]
-                    try:
-                        current["days_since_push"] = int(num)
-                    except Exception:
-                        pass
-            continue
-        m = DESC_RE.match(line.strip())
-        if m:
-            current["description"] = m.group("desc").strip()
-            continue
-
-    commit()
-    return items
+ITEM_RE = re.compile(_ITEM_PATTERN, re.M)
+# Same pattern over raw UTF-8 bytes (e.g. an mmap); the pattern itself is ASCII-only
+ITEM_RE_BYTES = re.compile(_ITEM_PATTERN.encode("ascii"), re.M)
 
 
-def recategorize_file(path: str, cats_config: list[str], cat_keywords: dict) -> tuple[int, int]:
-    with open(path, encoding="utf-8") as f:
-        lines = f.readlines()
+def _int_or_none(value: str | None) -> int | None:
+    return int(value) if value is not None else None
+
+
+def _item(fields: dict[str, str | None]) -> dict:
+    # The header groups are not optional in the pattern, so they are always captured
+    disc = fields["disc"]
+    return {
+        "name": cast(str, fields["name"]).strip(),
+        "url": cast(str, fields["url"]).strip(),
+        "score": float(cast(str, fields["score"])),
+        "license": (fields["license"] or "").strip(),
+        "stars": int(fields["stars"] or 0),
+        "forks": int(fields["forks"] or 0),
+        "prs_open": _int_or_none(fields["prs"]),
+        "has_discussions": disc.lower().startswith("yes") if disc else None,
+        "contributors_count": _int_or_none(fields["contrib"]),
+        "days_since_push": _int_or_none(fields["push"]),
+        "description": (fields["desc"] or "").strip(),
+    }
+
+
+def parse_items(text: str) -> list[dict]:
+    return [_item(m.groupdict()) for m in ITEM_RE.finditer(text)]
 
-    items = parse_items(lines)
+
+def parse_items_bytes(buf: bytes | mmap.mmap) -> list[dict]:
+    """Parse items from a bytes-like buffer; only the captured fields are decoded."""
+    return [
+        _item({k: v.decode("utf-8") if v is not None else None for k, v in m.groupdict().items()})
+        for m in ITEM_RE_BYTES.finditer(buf)
+    ]
+
+
+def _read_items(path: str) -> list[dict]:
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return []
+        # Unmapped before the caller rewrites the file in place
+        with mm:
+            return parse_items_bytes(mm)
+
+
+def recategorize_file(path: str, cats_config: list[str], cat_keywords: dict) -> tuple[int, int]:
+    items = _read_items(path)
     before = len(items)
 
+    # Index all category phrases once; each item is then a single scan of its text
+    matcher = build_matcher(cats_config, cat_keywords)
     for it in items:
         desc = it.get("description", "")
-        cats = categorize_repository(it.get("name", ""), desc, cats_config, cat_keywords)
+        cats = categorize_repository(it.get("name", ""), desc, cats_config, matcher=matcher)
         it["categories"] = cats or ["Uncategorized"]
 
-    # Re-render in place
-    render_markdown(items, path, cats_config)
+    # Re-render into memory, then swap it in atomically: one write, and a crash
+    # mid-write never leaves a truncated file behind
+    text = render_markdown_to_str(items, cats_config)
+    tmp = Path(f"{path}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
     after = len(items)
     return before, after
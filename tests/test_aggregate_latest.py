@@ -0,0 +1,43 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "aggregate_latest.py"
+_spec = importlib.util.spec_from_file_location("aggregate_latest", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+aggregate_latest = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(aggregate_latest)
+
+
+def _touch(directory: Path, name: str) -> None:
+    (directory / name).write_text(f"# {name}\n", encoding="utf-8")
+
+
+def test_find_latest_dated_file_skips_malformed_and_impossible_dates(tmp_path: Path):
+    for name in (
+        "healthtech-tools-2024-12-31.md",
+        "healthtech-tools-2025-01-15.md",
+        "healthtech-tools-2025-02-31.md",  # impossible date
+        "healthtech-tools-20251-1-01.md",  # malformed
+        "healthtech-tools-2025-13-01.md",  # no such month
+        "healthtech-tools.md",
+    ):
+        _touch(tmp_path, name)
+    latest = aggregate_latest.find_latest_dated_file(str(tmp_path))
+    assert latest == str(tmp_path / "healthtech-tools-2025-01-15.md")
+    assert aggregate_latest.find_latest_dated_file(str(tmp_path / "missing")) is None
+
+
+def test_main_falls_back_to_text_copy_when_copyfile_fails(tmp_path: Path, monkeypatch):
+    _touch(tmp_path, "healthtech-tools-2025-01-15.md")
+    out = tmp_path / "latest.md"
+
+    def _fail(src, dst):
+        raise OSError("copy_file_range not supported")
+
+    monkeypatch.setattr(aggregate_latest.shutil, "copyfile", _fail)
+    monkeypatch.setattr(
+        sys, "argv", ["aggregate_latest.py", "--dir", str(tmp_path), "--output", str(out)]
+    )
+    aggregate_latest.main()
+    assert out.read_text(encoding="utf-8") == "# healthtech-tools-2025-01-15.md\n"
@@ -1,7 +1,15 @@
+import pytest
+
 from hector.categorizer import (
+    SynTrie,
+    _automaton_hits,
+    _build_automaton,
+    _compile_category,
     _is_healthcare_relevant,
     _phrase_in_text,
+    build_matcher,
     categorize_repository,
+    merge_keywords,
 )
 
 # Task 10: Comprehensive categorizer tests
@@ -112,6 +120,42 @@ def test_phrase_in_text_normalized():
     assert _phrase_in_text("clinical", "clinical, AI diagnostics")
 
 
+def test_compile_category_single_alternation():
+    """One pattern per category keeps per-phrase boundary rules."""
+    pattern = _compile_category(("clinical nlp", "fhir", "ai"))
+    assert pattern.search("smartonfhir server")  # 3-8 char token: substring
+    assert pattern.search("uses clinical  nlp")  # multi-word: whitespace tolerant
+    assert pattern.search("ai triage")  # short token: word-bounded
+    assert not pattern.search("chain of clinical text and nlp")
+    assert _compile_category(("clinical nlp", "fhir", "ai")) is pattern  # cached
+
+
+def test_automaton_hits_respect_word_boundaries():
+    """Aho-Corasick scan applies the same boundary rules as the regex path."""
+    pytest.importorskip("ahocorasick")
+    automaton = _build_automaton(
+        (("Imaging", ("mri", "x-ray")), ("NLP", ("clinical nlp", "ner")), ("AI", ("ai",)))
+    )
+    assert _automaton_hits(automaton, "fmri x-ray") == {"Imaging"}
+    assert _automaton_hits(automaton, "clinical nlp and ner") == {"NLP"}
+    assert _automaton_hits(automaton, "chain planning") == set()
+    assert _automaton_hits(automaton, "ai-based") == {"AI"}
+
+
+def test_syn_trie_matches_tokens_and_loose_substrings():
+    """Token trie matches word-bounded phrases; loose tokens still match compounds."""
+    trie = SynTrie()
+    trie.insert("Clinical NLP", "NLP")
+    trie.insert("x-ray", "Imaging")
+    trie.insert("bioinformatics", "Genomics")
+    trie.insert("fhir", "FHIR")
+    assert trie.match("uses clinical nlp") == {"NLP"}
+    assert trie.match("clinical text and nlp") == set()
+    assert trie.match("bioinformatics-tools") == {"Genomics"}
+    assert trie.match("bioinformaticsx") == set()
+    assert trie.match("smartonfhir x-rays") == {"FHIR", "Imaging"}
+
+
 # Subtask 6: _is_healthcare_relevant allowlist (Task 3)
 def test_is_healthcare_relevant_basic():
     """Healthcare anchors should be detected."""
@@ -158,3 +202,32 @@ def test_categorize_repository_keyword_match():
 def test_categorize_repository_no_match():
     matched = categorize_repository("repo", "some description", ["Oncology"])
     assert matched == []
+
+
+def test_merge_keywords_cached_and_reusable():
+    """Merged keyword map is built once per config and accepted via kw_map."""
+    overrides = {"Oncology": ["tumor", "cancer"], "Telemedicine": ["teleconsult"]}
+    kw_map = merge_keywords(overrides)
+    assert merge_keywords(dict(overrides)) is kw_map
+    assert kw_map["Telemedicine"][-1] == "teleconsult"
+    matched = categorize_repository(
+        "onco-tools", "Clinical tumor board helper", ["Oncology"], kw_map=kw_map
+    )
+    assert matched == ["Oncology"]
+
+
+def test_build_matcher_reused_across_repos():
+    """A matcher built once gives the same answers as per-call categorization."""
+    cats = ["AI Diagnostics", "Telemedicine", "EHR & Clinical Systems", "Oncology"]
+    matcher = build_matcher(cats, {"Oncology": ["tumor"]})
+    assert matcher.hits("clinical tumor board") == {"Oncology"}
+    cases = [
+        ("openemr", "Electronic health records and medical practice management"),
+        ("telehealth-app", "Video visits for patients and clinicians"),
+        ("onco-tools", "Clinical tumor board helper"),
+        ("repo", "some description"),
+    ]
+    for name, desc in cases:
+        assert categorize_repository(name, desc, cats, matcher=matcher) == (
+            categorize_repository(name, desc, cats, {"Oncology": ["tumor"]})
+        )
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -27,3 +28,17 @@ def test_load_config_template(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     assert cfg["search"]["query"] == "test"
     assert cfg["output"]["file"] == "out.md"
     assert cfg.get("auth", {}).get("GITHUB_TOKEN") == "dummy-token"
+
+
+def test_load_config_cached_per_mtime(tmp_path: Path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("search: {query: one}\nweights: {}\noutput: {file: out.md}\n")
+
+    first = load_config(str(cfg_path))
+    first["search"]["query"] = "mutated"
+    assert load_config(str(cfg_path))["search"]["query"] == "one"
+
+    cfg_path.write_text("search: {query: two}\nweights: {}\noutput: {file: out.md}\n")
+    st = cfg_path.stat()
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_config(str(cfg_path))["search"]["query"] == "two"
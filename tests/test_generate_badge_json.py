@@ -0,0 +1,45 @@
+import importlib.util
+import json
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "generate_badge_json.py"
+_spec = importlib.util.spec_from_file_location("generate_badge_json", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+generate_badge_json = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generate_badge_json)
+
+_RESULTS = """# Curated Healthcare Technology Tools
+
+## Telemedicine
+- **[org/a](https://github.com/org/a)** (Score: 120.5)
+- **[org/b](https://github.com/org/b)** (Score: 7.0)
+"""
+
+
+def _run(tmp_path: Path, monkeypatch, capsys) -> str:
+    docs = tmp_path / "docs"
+    monkeypatch.setattr(generate_badge_json, "RESULT_LATEST", tmp_path / "latest.md")
+    monkeypatch.setattr(generate_badge_json, "DOCS_DIR", docs)
+    monkeypatch.setattr(generate_badge_json, "BADGES_DIR", docs / "badges")
+    assert generate_badge_json.main() == 0
+    return capsys.readouterr().out
+
+
+def test_badges_are_only_rewritten_when_disk_bytes_differ(tmp_path: Path, monkeypatch, capsys):
+    (tmp_path / "latest.md").write_text(_RESULTS, encoding="utf-8")
+    assert "Wrote 2 of 2 project badges" in _run(tmp_path, monkeypatch, capsys)
+    badge_a = tmp_path / "docs" / "badges" / "org__a.json"
+    assert json.loads(badge_a.read_bytes()) == {
+        "schemaVersion": 1,
+        "label": "Hector Score",
+        "message": "120.50",
+        "color": "yellowgreen",
+    }
+    fresh = badge_a.read_bytes()
+
+    assert "Wrote 0 of 2 project badges" in _run(tmp_path, monkeypatch, capsys)
+
+    # A badge changed outside this script (checkout, manual edit) is repaired
+    badge_a.write_bytes(b'{"stale": true}')
+    assert "Wrote 1 of 2 project badges" in _run(tmp_path, monkeypatch, capsys)
+    assert badge_a.read_bytes() == fresh
@@ -0,0 +1,102 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from hector.models import Item
+from hector.renderer import render_markdown_to_str
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "recategorize_md.py"
+_spec = importlib.util.spec_from_file_location("recategorize_md", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+recategorize_md = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(recategorize_md)
+
+CATEGORIES = ["Telemedicine"]
+
+
+def _items() -> list[Item]:
+    return [
+        Item(
+            name="owner/full",
+            url="https://github.com/owner/full",
+            score=42.5,
+            description="All metrics present",
+            categories=("Telemedicine",),
+            license="MIT",
+            stars=100,
+            forks=10,
+            prs_open=3,
+            has_discussions=True,
+            contributors_count=7,
+            days_since_push=5,
+        ),
+        # No PR count: the metrics line starts with "Discussions:"
+        Item(
+            name="owner/no-prs",
+            url="https://github.com/owner/no-prs",
+            score=12.0,
+            description="Kept after a partial metrics line",
+            categories=("Telemedicine",),
+            license="Apache-2.0",
+            stars=5,
+            forks=1,
+            has_discussions=False,
+            contributors_count=3,
+        ),
+        Item(
+            name="owner/push-only",
+            url="https://github.com/owner/push-only",
+            score=1.25,
+            description="Only the last push is known",
+            categories=("Telemedicine",),
+            license="NOASSERTION",
+            days_since_push=400,
+        ),
+        Item(
+            name="owner/bare",
+            url="https://github.com/owner/bare",
+            score=0.5,
+            categories=("Telemedicine",),
+            license="None",
+        ),
+    ]
+
+
+def test_parse_items_round_trips_rendered_markdown():
+    text = render_markdown_to_str(_items(), CATEGORIES)
+    parsed = recategorize_md.parse_items(text)
+    assert len(parsed) == 4
+    no_prs = parsed[1]
+    assert no_prs["prs_open"] is None
+    assert no_prs["has_discussions"] is False
+    assert no_prs["contributors_count"] == 3
+    assert no_prs["description"] == "Kept after a partial metrics line"
+    assert parsed[2]["days_since_push"] == 400
+    assert parsed[2]["description"] == "Only the last push is known"
+
+    for it in parsed:
+        it["categories"] = ("Telemedicine",)
+    assert render_markdown_to_str(parsed, CATEGORIES) == text
+
+
+def test_parse_items_bytes_matches_text_parser():
+    text = render_markdown_to_str(_items(), CATEGORIES)
+    assert recategorize_md.parse_items_bytes(text.encode("utf-8")) == (
+        recategorize_md.parse_items(text)
+    )
+
+
+def test_recategorize_file_removes_temp_file_when_replace_fails(tmp_path: Path, monkeypatch):
+    md = tmp_path / "tools.md"
+    original = render_markdown_to_str(_items(), CATEGORIES)
+    md.write_text(original, encoding="utf-8")
+
+    def _fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(recategorize_md.os, "replace", _fail)
+    with pytest.raises(OSError):
+        recategorize_md.recategorize_file(str(md), CATEGORIES, {})
+    assert md.read_text(encoding="utf-8") == original
+    assert not (tmp_path / "tools.md.tmp").exists()
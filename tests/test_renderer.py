@@ -1,6 +1,8 @@
+import io
 from pathlib import Path
 
-from hector.renderer import render_markdown
+from hector.models import Item
+from hector.renderer import render_markdown, render_markdown_to_str
 
 
 def test_render_markdown_includes_metrics(tmp_path: Path):
@@ -27,3 +29,33 @@ def test_render_markdown_includes_metrics(tmp_path: Path):
     assert "Discussions: Yes" in text
     assert "Contributors: 7" in text
     assert "Last push: 5 days ago" in text
+
+
+def test_render_markdown_accepts_items_and_dicts(tmp_path: Path):
+    as_item = Item(
+        name="owner/a",
+        url="https://github.com/owner/a",
+        score=10.0,
+        categories=("Telemedicine",),
+        license="MIT",
+    )
+    as_dict = {"name": "owner/b", "url": "https://github.com/owner/b", "score": 20.0}
+    out = tmp_path / "out.md"
+    render_markdown([as_item, as_dict], str(out), ["Telemedicine"])
+    text = out.read_text()
+    assert "## Telemedicine\n- **[owner/a]" in text
+    assert "## Uncategorized\n- **[owner/b]" in text
+
+
+def test_render_markdown_to_str_and_stream_match_file(tmp_path: Path):
+    items = [
+        Item(name="a/b", url="https://github.com/a/b", score=3.0, categories=("Telemedicine",)),
+        Item(name="c/d", url="https://github.com/c/d", score=7.5, categories=("Other",)),
+    ]
+    out = tmp_path / "out.md"
+    render_markdown(items, out, ["Telemedicine"])
+    buf = io.StringIO()
+    render_markdown(items, buf, ["Telemedicine"])
+    text = render_markdown_to_str(items, ["Telemedicine"])
+    assert text == buf.getvalue() == out.read_text(encoding="utf-8")
+    assert text.index("## Telemedicine") < text.index("## Other")
@@ -0,0 +1,79 @@
+import importlib.util
+import logging
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scan_and_curate.py"
+_spec = importlib.util.spec_from_file_location("scan_and_curate", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+scan_and_curate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(scan_and_curate)
+
+
+class _RateLimitError(Exception):
+    pass
+
+
+@pytest.fixture
+def rate_limit(monkeypatch):
+    monkeypatch.setattr(scan_and_curate, "_rate_limit_errors", lambda: (_RateLimitError,))
+
+
+def test_fetch_topics_fail_fast_propagates_rate_limit(rate_limit):
+    def _limited():
+        raise _RateLimitError()
+
+    repo = SimpleNamespace(get_topics=_limited)
+    assert scan_and_curate._fetch_topics(repo) == []
+    with pytest.raises(_RateLimitError):
+        scan_and_curate._fetch_topics(repo, fail_fast=True)
+
+
+def test_repo_topics_only_fetches_repos_without_topics():
+    def _no_call():
+        raise AssertionError("topics endpoint should not be called")
+
+    repos = [SimpleNamespace(get_topics=_no_call), SimpleNamespace(get_topics=lambda: ["fhir"])]
+    records = [{"topics": ["ehr"]}, {}]
+    log = logging.getLogger("hector")
+    assert scan_and_curate._repo_topics(repos, records, 4, log) == [["ehr"], ["fhir"]]
+
+
+def test_repo_topics_falls_back_to_serial_on_rate_limit(rate_limit):
+    lock = threading.Lock()
+    calls = []
+
+    def _topics(name):
+        def _get():
+            with lock:
+                calls.append(name)
+                # The first call inside the pool hits the rate limit
+                if len(calls) == 1:
+                    raise _RateLimitError()
+            return [name]
+
+        return _get
+
+    repos = [SimpleNamespace(get_topics=_topics(n)) for n in ("a", "b", "c")]
+    records: list[dict] = [{}, {}, {}]
+    log = logging.getLogger("hector")
+    assert scan_and_curate._repo_topics(repos, records, 2, log) == [["a"], ["b"], ["c"]]
+    assert calls[-3:] == ["a", "b", "c"]  # redone serially, in order
+
+
+def test_ensure_dir_creates_parents_once(tmp_path: Path):
+    d = str(tmp_path / "a" / "b")
+    scan_and_curate._ensure_dir(d)
+    assert Path(d).is_dir()
+    assert d in scan_and_curate._MADE_DIRS
+
+
+def test_ensure_dir_rejects_existing_file(tmp_path: Path):
+    f = tmp_path / "not-a-dir"
+    f.write_text("", encoding="utf-8")
+    with pytest.raises(FileExistsError):
+        scan_and_curate._ensure_dir(str(f))
+    assert str(f) not in scan_and_curate._MADE_DIRS
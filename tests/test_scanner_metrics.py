@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
-from hector.scanner import get_repo_metrics
+from hector import scanner
+from hector.scanner import get_repo_metrics, get_repos_metrics_batched, repo_fields
 
 
 class _Pulls:
@@ -32,6 +34,23 @@ class _Repo:
         return _Contribs(6)
 
 
+class _CountedContribs(_Contribs):
+    def __init__(self, total):
+        super().__init__(30)
+        self.totalCount = total
+
+
+class _BigRepo(_Repo):
+    def get_contributors(self):
+        return _CountedContribs(412)
+
+
+def test_get_repo_metrics_uses_total_count_for_contributors():
+    m = get_repo_metrics(_BigRepo())
+    assert m["contributors_count"] == 412
+    assert m["contributors_count_capped"] is False
+
+
 def test_get_repo_metrics_mocked():
     repo = _Repo()
     m = get_repo_metrics(repo)
@@ -39,3 +58,127 @@ def test_get_repo_metrics_mocked():
     assert m["has_discussions"] is True
     assert m["contributors_count"] == 6
     assert isinstance(m["days_since_push"], int) and m["days_since_push"] >= 7
+
+
+class _GraphQLResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def test_get_repos_metrics_batched_mocked(monkeypatch):
+    pushed = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+    calls = []
+
+    def _post(url, json, headers, timeout):
+        calls.append(json["variables"]["ids"])
+        nodes = [
+            {
+                "id": "R_1",
+                "pullRequests": {"totalCount": 2},
+                "hasDiscussionsEnabled": True,
+                "mentionableUsers": {"totalCount": 40},
+                "pushedAt": pushed,
+            },
+            None,
+        ]
+        return _GraphQLResponse({"data": {"nodes": nodes}})
+
+    monkeypatch.setattr(scanner, "requests", SimpleNamespace(post=_post))
+    repos = [SimpleNamespace(node_id="R_1"), SimpleNamespace(node_id="R_2"), SimpleNamespace()]
+    out = get_repos_metrics_batched(repos, "token")
+    assert calls == [["R_1", "R_2"]]
+    assert out[0]["prs_open"] == 2
+    assert out[0]["has_discussions"] is True
+    assert out[0]["contributors_count"] == 40
+    assert out[0]["days_since_push"] >= 3
+    assert out[1] is None and out[2] is None  # left for the REST fallback
+
+
+def test_repo_fields_prefers_raw_json():
+    raw = {"full_name": "org/repo", "stargazers_count": 12, "license": None}
+    assert repo_fields(SimpleNamespace(_rawData=raw, full_name="ignored")) is raw
+    fixture = SimpleNamespace(
+        full_name="org/repo", stargazers_count=12, license=SimpleNamespace(spdx_id="MIT")
+    )
+    rec = repo_fields(fixture)
+    assert rec["full_name"] == "org/repo"
+    assert rec["stargazers_count"] == 12
+    assert rec["license"] == {"spdx_id": "MIT"}
+    assert "forks_count" not in rec
+
+
+def test_relevance_uses_topics_from_raw_json():
+    def _no_call():
+        raise AssertionError("topics endpoint should not be called")
+
+    raw = {"name": "toolkit", "description": "data tools", "topics": ["healthcare"]}
+    repo = SimpleNamespace(_rawData=raw, name="toolkit", description="data tools")
+    repo.get_topics = _no_call
+    assert scanner.is_repo_healthcare_relevant(repo)
+
+
+def test_get_repo_metrics_single_graphql_query(monkeypatch):
+    calls = []
+
+    def _post(url, json, headers, timeout):
+        calls.append(json["variables"])
+        node = {
+            "pullRequests": {"totalCount": 9},
+            "hasDiscussionsEnabled": False,
+            "mentionableUsers": {"totalCount": 21},
+            "pushedAt": datetime.now(timezone.utc).isoformat(),
+        }
+        return _GraphQLResponse({"data": {"repository": node}})
+
+    monkeypatch.setattr(scanner, "requests", SimpleNamespace(post=_post))
+    repo = _Repo()
+    repo.full_name = "org/repo"
+    m = get_repo_metrics(repo, token="token")
+    assert calls == [{"owner": "org", "name": "repo"}]
+    assert m["prs_open"] == 9
+    assert m["contributors_count"] == 21
+    assert m["days_since_push"] == 0
+
+
+def test_get_repo_metrics_graphql_failure_falls_back_to_rest(monkeypatch):
+    def _post(url, json, headers, timeout):
+        return _GraphQLResponse({"errors": [{"message": "boom"}]})
+
+    monkeypatch.setattr(scanner, "requests", SimpleNamespace(post=_post))
+    repo = _Repo()
+    repo.full_name = "org/repo"
+    m = get_repo_metrics(repo, token="token")
+    assert m["prs_open"] == 4
+    assert m["contributors_count"] == 6
+
+
+def test_get_repos_metrics_batched_reads_node_id_from_raw_json(monkeypatch):
+    calls = []
+
+    def _post(url, json, headers, timeout):
+        calls.append(json["variables"]["ids"])
+        return _GraphQLResponse({"data": {"nodes": [None]}})
+
+    monkeypatch.setattr(scanner, "requests", SimpleNamespace(post=_post))
+    get_repos_metrics_batched([SimpleNamespace(_rawData={"node_id": "R_raw"})], "token")
+    assert calls == [["R_raw"]]
+
+
+def test_get_repos_metrics_batched_stops_after_failed_batch(monkeypatch):
+    calls = []
+
+    def _post(url, json, headers, timeout):
+        calls.append(json["variables"]["ids"])
+        raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(scanner, "requests", SimpleNamespace(post=_post))
+    repos = [SimpleNamespace(node_id=f"R_{i}") for i in range(5)]
+    out = get_repos_metrics_batched(repos, "token", batch_size=2)
+    assert calls == [["R_0", "R_1"]]
+    assert out == [None] * 5
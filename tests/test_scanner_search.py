@@ -0,0 +1,69 @@
+import time
+from types import SimpleNamespace
+
+from hector import scanner
+from hector.scanner import search_repositories
+
+
+def _repo(n):
+    return SimpleNamespace(id=n, full_name=f"org/repo{n}")
+
+
+class _Results:
+    def __init__(self, repos, delay=0.0):
+        self._repos = repos
+        self._delay = delay
+
+    def get_page(self, page):
+        time.sleep(self._delay)
+        return self._repos if page == 0 else []
+
+
+class _FakeGithub:
+    """Stands in for github.Github; one canned result list per language qualifier."""
+
+    by_lang: dict = {}
+    delays: dict = {}
+    queries: list = []
+
+    def __init__(self, token, per_page=30):
+        pass
+
+    def search_repositories(self, query, sort=None, order=None):
+        lang = query.rsplit("language:", 1)[1]
+        type(self).queries.append(lang)
+        return _Results(self.by_lang[lang], self.delays.get(lang, 0.0))
+
+
+def _search(monkeypatch, by_lang, limit, delays=None):
+    monkeypatch.setattr(_FakeGithub, "by_lang", by_lang)
+    monkeypatch.setattr(_FakeGithub, "delays", delays or {})
+    monkeypatch.setattr(_FakeGithub, "queries", [])
+    monkeypatch.setattr(scanner, "Github", _FakeGithub)
+    monkeypatch.setattr(scanner, "_SEARCH_WORKERS", 2)
+    cfg = {"auth": {"GITHUB_TOKEN": "token"}, "search": {"languages": list(by_lang)}}
+    return search_repositories(cfg, limit=limit)
+
+
+def test_search_merges_waves_in_work_list_order_and_dedupes(monkeypatch):
+    by_lang = {
+        "a": [_repo(1), _repo(2)],
+        "b": [_repo(2), _repo(3)],
+        "c": [_repo(1), _repo(4)],
+        "d": [_repo(5)],
+    }
+    # "a" finishes last within the first wave; its results still come first
+    repos = _search(monkeypatch, by_lang, limit=10, delays={"a": 0.05})
+    assert [r.id for r in repos] == [1, 2, 3, 4, 5]
+
+
+def test_search_limit_stops_later_waves(monkeypatch):
+    by_lang = {
+        "a": [_repo(1), _repo(2)],
+        "b": [_repo(3), _repo(4)],
+        "c": [_repo(5)],
+        "d": [_repo(6)],
+    }
+    repos = _search(monkeypatch, by_lang, limit=3)
+    assert [r.id for r in repos] == [1, 2, 3]
+    assert sorted(_FakeGithub.queries) == ["a", "b"]  # the second wave never ran
@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from hector.scorer import score_repository
+from hector.scorer import compile_weights, score_repositories, score_repository
 
 
 def make_repo(stars=10, forks=5, issues=2, license_spdx="MIT"):
@@ -160,3 +160,56 @@ def test_score_missing_repo_attributes():
     score = score_repository(repo, weights)
     # Missing attributes default to 0; license defaults to "none" → 50
     assert score == 50.0
+
+
+def test_score_with_compiled_weights_matches_raw_weights():
+    """A precompiled WeightVec scores identically to the raw weights mapping."""
+    repo = make_repo(stars=100, forks=10, issues=5, license_spdx="Apache-2.0")
+    weights = {
+        "stars": 0.1,
+        "forks": 0.2,
+        "open_issues": -0.5,
+        "contributors": 1.0,
+        "recency_decay": 2.0,
+        "license": {"Apache-2.0": 50, "none": -100},
+    }
+    metrics = {"contributors_count": 10, "days_since_push": 30}
+    vec = compile_weights(weights)
+    assert score_repository(repo, vec, metrics) == score_repository(repo, weights, metrics)
+
+
+def test_score_repositories_matches_per_repo_scoring():
+    """Batch scoring returns the same scores as scoring each repo on its own."""
+    repos = [
+        make_repo(stars=100, forks=10, issues=5, license_spdx="MIT"),
+        make_repo(stars=0, forks=0, issues=0, license_spdx=None),
+        SimpleNamespace(full_name="org/clinical-notes", description="clinical NLP"),
+    ]
+    metrics_list = [{"prs_open": 3, "has_discussions": True}, None, {"days_since_push": 45}]
+    weights = {
+        "stars": 0.1,
+        "forks": 0.2,
+        "open_issues": -0.5,
+        "prs": 0.5,
+        "discussions": 2.0,
+        "recency_decay": 1.0,
+        "health_relevance_boost": 10.0,
+        "license": {"MIT": 25, "none": -5},
+    }
+    expected = [score_repository(r, weights, m) for r, m in zip(repos, metrics_list)]
+    assert score_repositories(repos, weights, metrics_list) == expected
+    assert score_repositories([], weights) == []
+
+
+def test_score_accepts_plain_dict():
+    """A dict in GitHub's JSON shape scores the same as the equivalent object."""
+    weights = {"stars": 0.1, "forks": 0.2, "open_issues": -0.5, "license": {"MIT": 50}}
+    repo = make_repo(stars=100, forks=10, issues=5, license_spdx="MIT")
+    raw = {
+        "stargazers_count": 100,
+        "forks_count": 10,
+        "open_issues_count": 5,
+        "license": {"spdx_id": "MIT"},
+    }
+    assert score_repository(raw, weights) == score_repository(repo, weights)
+    assert score_repositories([raw], weights) == [score_repository(repo, weights)]